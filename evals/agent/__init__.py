@@ -1,18 +1,46 @@
+import functools
 import logging
 
-from .orchestrator import OrchestratorEvaluation
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-logging.basicConfig(level=logging.INFO)
+# Sole logging configurator for the evals package; skip when the host
+# process (e.g. service/initialize.py) has already attached handlers.
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-evaluators = [
-    ("orchestrator", OrchestratorEvaluation()),
-]
+
+@functools.lru_cache(maxsize=1)
+def _get_evaluators():
+    """
+    Builds the evaluator list (and loads the environment) exactly once per
+    process, mirroring the @lru_cache initialize() pattern in
+    service/initialize.py. Deferring the imports keeps `import evals.agent`
+    from pulling in mlflow/litellm/pilotx_agent until an evaluation runs.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    from .orchestrator import OrchestratorEvaluation
+
+    return [
+        ("orchestrator", OrchestratorEvaluation()),
+    ]
+
 
 def run_evaluation():
-    for e, runner in evaluators:
-        logger.info(f"Evaluating {e}")
-        runner.run()
+    # Each runner targets its own MLflow experiment/run, so the outer loop is
+    # embarrassingly parallel: dispatch them concurrently and log as they finish.
+    evaluators = _get_evaluators()
+    with ThreadPoolExecutor(max_workers=len(evaluators)) as executor:
+        futures = {}
+        for e, runner in evaluators:
+            logger.info(f"Evaluating {e}")
+            futures[executor.submit(runner.run)] = e
+        for future in as_completed(futures):
+            future.result()
+            logger.info(f"Finished evaluating {futures[future]}")
 
 
-__all__ = [run_evaluation]
\ No newline at end of file
+__all__ = ["run_evaluation"]
@@ -1,14 +1,18 @@
+import atexit
 import logging
 import os
+import threading
 from abc import ABC
 from functools import partial
 from typing import Any, List, Union, Tuple
-from uuid import uuid4
 
 import mlflow
+import pandas as pd
+from mlflow.entities import ViewType
 from mlflow.genai import Scorer
 from mlflow.genai.evaluation.entities import EvaluationResult
 from mlflow.genai.scorers import Guidelines
+from mlflow.tracking import MlflowClient
 
 from pilotx_agent.agents.abstract import (
     AbstractAgent,
@@ -19,9 +23,31 @@ from pilotx_agent.agents.abstract import (
 
 from .utils import run_agent
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Process-wide MLflow bootstrap state. Autolog monkey-patches the OpenAI
+# client modules and set_tracking_uri mutates global config, so both should
+# happen once per process rather than once per run_eval.
+_BOOTSTRAP_LOCK = threading.Lock()
+_autolog_enabled = False
+_tracking_uri_set = None
+
+
+def _bootstrap_mlflow(tracking_uri: str) -> None:
+    global _autolog_enabled, _tracking_uri_set
+    with _BOOTSTRAP_LOCK:
+        if tracking_uri != _tracking_uri_set:
+            mlflow.set_tracking_uri(tracking_uri)
+            _tracking_uri_set = tracking_uri
+        if not _autolog_enabled:
+            # Buffer span export on a background thread so per-row traces from
+            # run_agent don't pay a tracking-server round-trip inline; flush
+            # at interpreter exit so nothing is lost on shutdown.
+            os.environ.setdefault("MLFLOW_ENABLE_ASYNC_TRACE_LOGGING", "true")
+            mlflow.openai.autolog()
+            atexit.register(mlflow.flush_trace_async_logging)
+            _autolog_enabled = True
+
 
 class AgentEvaluator:
     def __init__(
@@ -34,9 +60,7 @@ class AgentEvaluator:
         ],
         experiment: str = "pilotx",
     ):
-        logging.info(
-            f"Starting Agent evaluation with experiment: {experiment}"
-        )
+        logger.info("Starting Agent evaluation with experiment: %s", experiment)
         self.instance = instance
         self.experiment = experiment
 
@@ -46,8 +70,21 @@ class AgentEvaluator:
                 "MLFLOW_TRACKING_URI must be set, it must point to a valid MLflow 3.0 tracking server."
             )
 
+        # Memoized tracking-server lookups; both are stable for the lifetime
+        # of this evaluator, so repeated run_eval calls skip the round-trips.
+        self._experiment_id = None
+        self._run_cache: dict[str, Tuple[str, str]] = {}
+
+        _bootstrap_mlflow(self.tracking_uri)
+
+        # Build the runner (HTTP client, tool registry, session service) once
+        # up front so per-row predict calls only pay for invoke().
+        _ = self.instance.runner
+
     def _get_or_create_experiment(self) -> str:
-        mlflow.set_tracking_uri(self.tracking_uri)
+        if self._experiment_id is not None:
+            return self._experiment_id
+
         mlflow.set_experiment(self.experiment)
 
         exp = mlflow.get_experiment_by_name(self.experiment)
@@ -62,21 +99,28 @@ class AgentEvaluator:
             exp.experiment_id,
             exp.artifact_location,
         )
+        self._experiment_id = exp.experiment_id
         return exp.experiment_id
 
     def _get_or_create_run(self, run_name: str, tag_name: str = "agentEval") -> Tuple[str, str]:
+        if run_name in self._run_cache:
+            return self._run_cache[run_name]
+
         experiment_id = self._get_or_create_experiment()
 
-        # Look for an existing run with this logical ID
-        existing = mlflow.search_runs(
+        # Look for an existing run with this logical ID. MlflowClient returns
+        # Run entities directly, skipping the DataFrame materialization that
+        # dominates mlflow.search_runs wall time.
+        existing = MlflowClient().search_runs(
             experiment_ids=[experiment_id],
             filter_string=f"tags.{tag_name} = '{run_name}'",
+            run_view_type=ViewType.ALL,
             max_results=1,
         )
 
         if len(existing) > 0:
             # Run exists → just return its ID, do NOT start it here
-            run_id = existing.iloc[0].run_id
+            run_id = existing[0].info.run_id
         else:
             # No run -> create a new one and tag it with the logical ID,
             # then end it so it's not active anymore.
@@ -86,20 +130,20 @@ class AgentEvaluator:
 
             # at this point the run is ENDED; we can reopen it later by run_id
 
+        self._run_cache[run_name] = (experiment_id, run_id)
         return experiment_id, run_id
 
     def run_eval(
         self,
         scorers: List[Scorer],
-        dataset: list[dict],
+        dataset: Union[pd.DataFrame, list[dict]],
     ) -> EvaluationResult:
-        # Enable OpenAI / GenAI autologging
-        mlflow.openai.autolog()
-
         run_name = f"{self.instance.config.name}-eval"
         experiment_id, run_id = self._get_or_create_run(run_name=run_name)
         logger.info(
-            f"Using MLflow experiment_id={experiment_id}, run_id={run_id} for agent evaluation"
+            "Using MLflow experiment_id=%s, run_id=%s for agent evaluation",
+            experiment_id,
+            run_id,
         )
 
         # Now we start the run exactly once and keep it active during evaluation
@@ -124,7 +168,6 @@ class AgentEvaluator:
                         run_agent,
                         instance=self.instance,
                         user_id="eval-user",
-                        session_id=str(uuid4()),
                     ),
                     scorers=scorers,
                 )
@@ -165,7 +208,7 @@ class AbstractEvaluationRunner(ABC):
     def get_scorers(self) -> List[Union[Guidelines, Scorer]]:
         raise NotImplementedError
 
-    def get_dataset(self) -> list[dict]:
+    def get_dataset(self) -> Union[pd.DataFrame, list[dict]]:
         raise NotImplementedError
 
     def run(self) -> EvaluationResult:
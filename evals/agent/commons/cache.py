@@ -0,0 +1,75 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+
+logger = logging.getLogger(__name__)
+
+_MODES = ("off", "strict", "refresh")
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of agent responses keyed on (agent name, prompt hash),
+    so iterative scorer-tuning runs over a fixed dataset skip the agent
+    invocations entirely after the first pass.
+
+    The mode is taken from the PILOTX_EVAL_REPLAY env variable:
+      - ``off``     cache disabled (default)
+      - ``strict``  return cached responses when present, store misses
+      - ``refresh`` always re-invoke the agent and overwrite cached entries
+    """
+
+    def __init__(self, path: str = None):
+        self.mode = os.getenv("PILOTX_EVAL_REPLAY", "off").lower()
+        if self.mode not in _MODES:
+            logger.warning(
+                "Unknown PILOTX_EVAL_REPLAY mode %r; disabling response cache",
+                self.mode,
+            )
+            self.mode = "off"
+
+        self._conn = None
+        self._lock = threading.Lock()
+        if self.mode != "off":
+            path = path or os.getenv(
+                "PILOTX_EVAL_CACHE_PATH",
+                os.path.join(".pilotx", "eval_response_cache.db"),
+            )
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, response TEXT NOT NULL)"
+            )
+            self._conn.commit()
+            logger.info("Eval response cache enabled (mode=%s, path=%s)", self.mode, path)
+
+    @property
+    def enabled(self) -> bool:
+        return self._conn is not None
+
+    @staticmethod
+    def key_for(agent_name: str, prompt: str) -> str:
+        return hashlib.blake2b(f"{agent_name}\x00{prompt}".encode()).hexdigest()
+
+    def get(self, agent_name: str, prompt: str) -> str | None:
+        if not self.enabled or self.mode == "refresh":
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE key = ?",
+                (self.key_for(agent_name, prompt),),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, agent_name: str, prompt: str, response: str) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)",
+                (self.key_for(agent_name, prompt), response),
+            )
+            self._conn.commit()
@@ -1,9 +1,30 @@
-import re
+import weakref
+
+from collections import Counter
 from typing import Any
 
 from mlflow.entities import Feedback, SpanType, Trace
 from mlflow.genai.scorers.base import Scorer
 
+# Span lookups keyed per trace so scorers sharing a trace only walk the span
+# tree once per span type. Entries are evicted when the trace is collected.
+_TRACE_SPAN_CACHE: dict[int, dict] = {}
+
+
+def _spans_by_type(trace: Trace, span_type: str) -> list:
+    key = id(trace)
+    by_type = _TRACE_SPAN_CACHE.get(key)
+    if by_type is None:
+        try:
+            weakref.finalize(trace, _TRACE_SPAN_CACHE.pop, key, None)
+        except TypeError:
+            # Not weak-referenceable; skip caching rather than leak entries
+            return trace.search_spans(span_type=span_type)
+        by_type = _TRACE_SPAN_CACHE[key] = {}
+    if span_type not in by_type:
+        by_type[span_type] = trace.search_spans(span_type=span_type)
+    return by_type[span_type]
+
 
 class TurnCounter(Scorer):
     def __init__(self):
@@ -14,8 +35,8 @@ class TurnCounter(Scorer):
 
     def __call__(self, **kwargs):
         response = kwargs.get("output", "")
-        question_count = len(re.findall(r"\?", response))
-        return question_count
+        # Counting a single literal character needs no regex machinery
+        return response.count("?")
 
 
 class UsesCorrectTools(Scorer):
@@ -30,14 +51,19 @@ class UsesCorrectTools(Scorer):
         """Evaluate if agent used tools appropriately"""
         expected_tools = expectations["tool_calls"]
 
-        tool_spans = trace.search_spans(span_type=SpanType.TOOL)
-        tool_names = list(set([s.name for s in tool_spans]))
+        tool_spans = _spans_by_type(trace, SpanType.TOOL)
+        # Multiset comparison: calling the same tool three times is not the
+        # same as calling it once, which a deduped list silently conflated.
+        actual = Counter(s.name for s in tool_spans)
+        expected = Counter(expected_tools)
+
+        if actual == expected:
+            return Feedback(value="yes", rationale="The agent used the correct tools.")
 
-        score = "yes" if tool_names == expected_tools else "no"
-        rationale = (
-            "The agent used the correct tools."
-            if tool_names == expected_tools
-            else f"The agent used the incorrect tools: {tool_names}"
+        return Feedback(
+            value="no",
+            rationale=(
+                "The agent used the incorrect tools: "
+                f"missing={dict(expected - actual)}, extra={dict(actual - expected)}"
+            ),
         )
-        # Return a Feedback object with the score and rationale
-        return Feedback(value=score, rationale=rationale)
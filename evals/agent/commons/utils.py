@@ -1,22 +1,67 @@
 import asyncio
+import hashlib
+import json
 import logging
+import os
+import threading
+
+from itertools import count
+
+import httpx
 import litellm
 import mlflow
 
 from typing import Union
 from pilotx_agent.agents.abstract import AbstractAgent, AbstractSequentialAgent
 
+from .cache import ResponseCache
 
-@mlflow.trace
-def run_agent(
-    prompt: str,
+# One shared event loop on a daemon thread instead of a fresh loop per row.
+# MLflow's evaluator calls predict_fn from a ThreadPoolExecutor; funnelling the
+# agent coroutines onto a single loop lets litellm/httpx connection pools stay
+# warm across rows, with the semaphore bounding in-flight agent invocations.
+_MAX_CONCURRENCY = int(os.getenv("PILOTX_EVAL_MAX_CONCURRENCY", "8"))
+
+_LOOP = asyncio.new_event_loop()
+threading.Thread(target=_LOOP.run_forever, name="pilotx-eval-loop", daemon=True).start()
+_SEMAPHORE = asyncio.Semaphore(_MAX_CONCURRENCY)
+
+# Hand litellm one pooled async client so rows reuse connections (and their
+# TLS handshakes) instead of litellm building short-lived clients per call.
+# The client is loop-agnostic until first use, which happens on _LOOP above.
+litellm.aclient_session = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+)
+
+_RESPONSE_CACHE = ResponseCache()
+
+# Monotonic suffix for per-row session ids; avoids a urandom read per row
+_SESSION_SEQ = count()
+
+# In-process memo for repeated (agent, prompt) invocations within one run —
+# re-running a flaky eval or a second scorer pass replays instantly instead of
+# re-invoking the LLM. Opt-in (PILOTX_EVAL_MEMO=1), mirroring the sqlite
+# replay cache: a memo hit skips the agent entirely, so the row's trace has
+# no tool spans and trace-based scorers like UsesCorrectTools would mark
+# every replayed row wrong. Only enable for runs that don't score traces.
+_MEMO_ENABLED = os.getenv("PILOTX_EVAL_MEMO", "") == "1"
+_MEMO: dict[tuple[str, str], object] = {}
+
+
+def _agent_name(instance: Union[AbstractAgent, AbstractSequentialAgent]) -> str:
+    config = getattr(instance, "config", None)
+    return config.name if config else instance.agent.name
+
+
+async def _invoke_with_error_handling(
     instance: Union[AbstractAgent, AbstractSequentialAgent],
+    prompt: str,
     user_id: str,
     session_id: str,
-    timeout: int = 1200,
+    timeout: int,
 ) -> str:
-    async def get_response():
-        try:
+    try:
+        async with _SEMAPHORE:
             res = await asyncio.wait_for(
                 instance.runner.invoke(
                     prompt=prompt,
@@ -26,29 +71,136 @@ def run_agent(
                 timeout=timeout,
             )
             return res
-        except asyncio.TimeoutError:
-            logging.warning(
-                f"Agent execution timed out for prompt: {prompt[:100]}..."
-            )
-            return "Error: Agent execution timed out."
-        except asyncio.CancelledError:
-            logging.warning(
-                f"Agent execution cancelled for prompt: {prompt[:100]}..."
-            )
-            return "Error: Agent execution cancelled."
-        except litellm.exceptions.RateLimitError:
-            logging.warning(
-                f"Agent execution hit rate limit for prompt: {prompt[:100]}..."
-            )
-            return "Error: Agent execution hit rate limit."
-        except Exception as e:
-            logging.error(f"Agent execution failed: {e}")
-            return f"Error: Agent execution failed - {str(e)}"
+    except asyncio.TimeoutError:
+        # %.100s truncates lazily, only when the record is actually emitted
+        logging.warning("Agent execution timed out for prompt: %.100s...", prompt)
+        return "Error: Agent execution timed out."
+    except asyncio.CancelledError:
+        logging.warning("Agent execution cancelled for prompt: %.100s...", prompt)
+        return "Error: Agent execution cancelled."
+    except litellm.exceptions.RateLimitError:
+        logging.warning("Agent execution hit rate limit for prompt: %.100s...", prompt)
+        return "Error: Agent execution hit rate limit."
+    except Exception as e:
+        logging.error("Agent execution failed: %s", e)
+        return f"Error: Agent execution failed - {str(e)}"
+
+
+def run_agent(
+    prompt: str,
+    instance: Union[AbstractAgent, AbstractSequentialAgent],
+    user_id: str,
+    session_id: str | None = None,
+    timeout: int = 1200,
+) -> str:
+    if session_id is None:
+        # Fresh session per row so rows never leak context into each other;
+        # the prompt hash keeps ids recognisable when debugging traces.
+        digest = hashlib.blake2b(prompt.encode(), digest_size=8).hexdigest()
+        session_id = f"eval-{digest}-{next(_SESSION_SEQ)}"
+
+    agent_name = _agent_name(instance)
+    memo_key = (agent_name, prompt)
+    if _MEMO_ENABLED and memo_key in _MEMO:
+        return _MEMO[memo_key]
+
+    cached = _RESPONSE_CACHE.get(agent_name, prompt)
+    if cached is not None:
+        return json.loads(cached)
 
     try:
-        # Run the async function in a fresh event loop
-        response = asyncio.run(get_response())
+        # Submit onto the persistent loop; block this (worker) thread on the result
+        future = asyncio.run_coroutine_threadsafe(
+            _invoke_with_error_handling(instance, prompt, user_id, session_id, timeout),
+            _LOOP,
+        )
+        # No outer deadline: the row's wait_for budget only starts once the
+        # semaphore is acquired, so a wall-clock bound here would tick during
+        # queue wait and spuriously fail rows queued behind a full semaphore.
+        response = future.result()
+        # Error strings are deliberately not cached so reruns retry them
+        if not (isinstance(response, str) and response.startswith("Error:")):
+            if _MEMO_ENABLED:
+                _MEMO[memo_key] = response
+            _RESPONSE_CACHE.put(agent_name, prompt, json.dumps(response, default=str))
         return response
     except Exception as e:
-        logging.error(f"Evaluation function failed: {e}")
-        return f"Evaluation Error: {str(e)}"
\ No newline at end of file
+        logging.error("Evaluation function failed: %s", e)
+        return f"Evaluation Error: {str(e)}"
+
+
+# runner.invoke already emits its own root span, so wrapping run_agent in
+# @mlflow.trace doubled the exported span volume per row. Opt back in per run
+# when a correlation span is wanted.
+if os.getenv("PILOTX_TRACE_EVAL_ROWS"):
+    run_agent = mlflow.trace(run_agent)
+
+
+def run_agent_batch(
+    prompts: list[str],
+    instance: Union[AbstractAgent, AbstractSequentialAgent],
+    user_id: str,
+    session_id_prefix: str,
+    timeout: int = 1200,
+) -> list[str]:
+    """
+    Runs every prompt concurrently on the shared event loop instead of paying
+    one `asyncio.run` per row. Each prompt gets its own session derived from
+    ``session_id_prefix`` and keeps the same timeout/error-string semantics as
+    `run_agent`, so a failure on one row never aborts the batch. Results feed
+    the same memo/response caches as `run_agent`.
+
+    Entry point for ad-hoc batch runs outside `mlflow.genai.evaluate` (smoke
+    passes, dataset pre-screening). It is deliberately NOT called ahead of
+    row-wise evaluation: invoking prompts outside predict_fn and replaying
+    them from the memo would leave every evaluation row's trace without tool
+    spans, breaking trace-based scorers like UsesCorrectTools.
+    """
+    agent_name = _agent_name(instance)
+
+    responses: list = [None] * len(prompts)
+    pending: list[tuple[int, str]] = []
+    for i, prompt in enumerate(prompts):
+        if _MEMO_ENABLED and (agent_name, prompt) in _MEMO:
+            responses[i] = _MEMO[(agent_name, prompt)]
+            continue
+        cached = _RESPONSE_CACHE.get(agent_name, prompt)
+        if cached is not None:
+            responses[i] = json.loads(cached)
+            continue
+        pending.append((i, prompt))
+
+    if not pending:
+        return responses
+
+    async def gather_responses() -> list[str]:
+        coros = [
+            _invoke_with_error_handling(
+                instance, prompt, user_id, f"{session_id_prefix}-{i}", timeout
+            )
+            for i, prompt in pending
+        ]
+        return list(await asyncio.gather(*coros))
+
+    try:
+        future = asyncio.run_coroutine_threadsafe(gather_responses(), _LOOP)
+        # No batch-wide deadline: rows run at most _MAX_CONCURRENCY at a
+        # time, so a fixed timeout+5 bound was guaranteed to fire on large
+        # batches and throw away every completed row with it. Each row is
+        # individually bounded by its wait_for once past the semaphore.
+        results = future.result()
+    except Exception as e:
+        logging.error("Evaluation function failed: %s", e)
+        results = [f"Evaluation Error: {str(e)}"] * len(pending)
+
+    for (i, prompt), response in zip(pending, results):
+        responses[i] = response
+        # Error strings are deliberately not cached so reruns retry them
+        if not (
+            isinstance(response, str)
+            and response.startswith(("Error:", "Evaluation Error:"))
+        ):
+            if _MEMO_ENABLED:
+                _MEMO[(agent_name, prompt)] = response
+            _RESPONSE_CACHE.put(agent_name, prompt, json.dumps(response, default=str))
+    return responses
@@ -1,5 +1,7 @@
 from typing import List, Union
 
+import pandas as pd
+
 from mlflow.genai import Scorer
 from mlflow.genai.scorers import Guidelines, Correctness
 
@@ -26,7 +28,7 @@ class OrchestratorEvaluation(AbstractEvaluationRunner):
         ]
         return scorers
 
-    def get_dataset(self) -> list[dict]:
+    def get_dataset(self) -> pd.DataFrame:
         data = [
             {
                 "inputs": {
@@ -39,4 +41,6 @@ class OrchestratorEvaluation(AbstractEvaluationRunner):
                 },
             }
         ]
-        return data
+        # Column-oriented frame so mlflow.genai.evaluate slices columns
+        # directly instead of reshaping a list of row dicts.
+        return pd.DataFrame(data)
@@ -1,8 +1,5 @@
-from dotenv import load_dotenv
 from agent import run_evaluation
 
-load_dotenv()
-
 
 def main():
     run_evaluation()
@@ -1,9 +1,13 @@
+import asyncio
 import logging
 import os
-import mlflow
-import json
+import threading
+import time
+
+import orjson
 
 from abc import ABC
+from collections import OrderedDict
 from typing import Optional, Dict, Any, AsyncGenerator, List
 
 from google.adk.agents.callback_context import CallbackContext
@@ -21,27 +25,151 @@ from google.adk.runners import Runner
 from google.adk.sessions import (
     InMemorySessionService,
     Session,
-    DatabaseSessionService,
 )
 from google.adk.tools import load_memory, FunctionTool
 from google.adk.tools.base_tool import BaseTool
 from google.adk.tools.tool_context import ToolContext
 from google.genai.types import Content, Part
-from mlflow.entities import SpanType
 from pydantic import BaseModel
 from pydantic import ValidationError
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-)
 
 from .entities import AgentConfig, ContentRoles, SessionType, AgentType
-from ..storage import FirestoreSessionService
 
 logger = logging.getLogger(__name__)
 
+# Tracing stays on by default; set PILOTX_TRACE_ENABLED=false to skip both
+# the mlflow import and the invoke() decorator entirely (applied at module
+# end) so disabled deployments carry zero tracing overhead.
+_TRACE_ENABLED = os.getenv("PILOTX_TRACE_ENABLED", "true").lower() not in (
+    "0",
+    "false",
+)
+
+_USER_ROLE = ContentRoles.User.value
+
+
+def _user_content(prompt: str) -> Content:
+    """
+    Wraps a prompt in a user-role Content via ``model_construct``, skipping
+    pydantic validation — the prompt is already a typed str at the API
+    boundary, so there is nothing left to validate per turn.
+    """
+    return Content.model_construct(
+        role=_USER_ROLE, parts=[Part.model_construct(text=prompt)]
+    )
+
+
+# Chunk templates shared by every stream: the consumers expect plain dicts,
+# and copying a prebuilt table is cheaper than re-evaluating a five-key
+# literal for every streamed token.
+_TEXT_TEMPLATE = {
+    "agent": None,
+    "type": "text",
+    "content": None,
+    "function_name": None,
+    "lastResponse": False,
+}
+
+_FUNCTION_CALL_TEMPLATE = {
+    "agent": None,
+    "type": "function_call",
+    "content": None,
+    "function_name": None,
+    "lastResponse": False,
+}
+
+_FUNCTION_RESPONSE_TEMPLATE = {
+    "agent": None,
+    "type": "function_response",
+    "content": None,
+    "function_name": None,
+    "lastResponse": False,
+}
+
+
+def _text_chunk(author: str, text_buf: list[str]) -> dict[str, Any]:
+    """
+    Builds the streamed text chunk for one or more coalesced text parts.
+    """
+    chunk = _TEXT_TEMPLATE.copy()
+    chunk["agent"] = author
+    chunk["content"] = text_buf[0] if len(text_buf) == 1 else "".join(text_buf)
+    return chunk
+
+
+# One LiteLlm per model name, shared by every agent using that model, so
+# they ride a single HTTP connection pool instead of warming one each.
+_LITELLM_CACHE: dict[str, LiteLlm] = {}
+_LITELLM_CACHE_LOCK = threading.Lock()
+
+
+def _get_litellm(model_name: str) -> LiteLlm:
+    model = _LITELLM_CACHE.get(model_name)
+    if model is None:
+        with _LITELLM_CACHE_LOCK:
+            model = _LITELLM_CACHE.get(model_name)
+            if model is None:
+                model = _LITELLM_CACHE[model_name] = LiteLlm(model=model_name)
+    return model
+
+
+# Directories already created this process; lets repeat AgentRunner
+# constructions skip the mkdir syscall.
+_CREATED_DIRS: set[str] = set()
+
+
+def _make_database_session():
+    from google.adk.sessions import DatabaseSessionService
+
+    state_path_prefix = os.environ.get("STATE_PATH", None)
+    if state_path_prefix is None:
+        state_path_prefix = "."
+    elif state_path_prefix not in _CREATED_DIRS:
+        os.makedirs(state_path_prefix, exist_ok=True)
+        _CREATED_DIRS.add(state_path_prefix)
+
+    db_path = f"sqlite:///{os.path.join(state_path_prefix, 'agent_session_state.db')}"
+    return DatabaseSessionService(db_path)
+
+
+def _make_firestore_session():
+    from ..storage import FirestoreSessionService
+
+    try:
+        session = FirestoreSessionService()
+        logger.info(f"Initialized Firestore service with config: {session}")
+        return session
+    except Exception as e:
+        logger.error(f"Failed to initialize Firestore session service: {e}")
+        logger.warning("Falling back to InMemory session service")
+        return InMemorySessionService()
+
+
+# The unused backends never get imported: DatabaseSessionService pulls in
+# sqlalchemy and FirestoreSessionService the google-cloud client, both dead
+# weight for the default InMemory configuration.
+_SESSION_FACTORIES = {
+    SessionType.Database: _make_database_session,
+    SessionType.Firestore: _make_firestore_session,
+    SessionType.InMemory: InMemorySessionService,
+}
+
+
+def _agent_uses_memory(
+    agent: Agent | SequentialAgent | ParallelAgent | LoopAgent,
+) -> bool:
+    """
+    Walks the agent tree and reports whether any agent carries the
+    ``load_memory`` tool, i.e. whether a memory service is needed at all.
+    """
+    for tool in getattr(agent, "tools", None) or []:
+        if tool is load_memory:
+            return True
+    for sub_agent in getattr(agent, "sub_agents", None) or []:
+        if _agent_uses_memory(sub_agent):
+            return True
+    return False
+
 
 class AgentRunner:
     """
@@ -55,43 +183,55 @@ class AgentRunner:
     :type runner: Runner
     :ivar session: Service object for session management.
     :type session: InMemorySessionService | DatabaseSessionService | MongoDBSessionService | FirestoreSessionService
-    :ivar memory: Service object for managing memory storage.
-    :type memory: InMemoryMemoryService
+    :ivar memory: Service object for managing memory storage, or None when no
+        agent in the tree uses the memory tool.
+    :type memory: Optional[InMemoryMemoryService]
     """
 
-    runner = None
-    session = None
-    memory = InMemoryMemoryService()
+    __slots__ = (
+        "runner",
+        "session",
+        "memory",
+        "_session_cache",
+        "_warm_task",
+        "_expects_json",
+    )
+
+    # Sessions looked up within the last TTL are served from an in-process
+    # cache, saving the existence-check round-trip on every follow-up turn.
+    _SESSION_CACHE_TTL = 30.0
+    _SESSION_CACHE_MAX = 1024
+
+    # Shared across streams; never mutated, so one validated instance suffices
+    _SSE_RUN_CONFIG = RunConfig(streaming_mode=StreamingMode.SSE)
+
+    # Force a scheduling point every N streamed events so a bursty stream
+    # cannot starve other coroutines sharing the loop.
+    _EVENTS_PER_SCHED_POINT = 8
 
     def __init__(
         self,
         agent: Agent | SequentialAgent | ParallelAgent | LoopAgent,
         session_type: SessionType = SessionType.InMemory,
         plugins: Optional[List[BasePlugin]] = None,
+        expects_json: bool = False,
     ) -> None:
-        if session_type == SessionType.Database:
-            state_path_prefix = os.environ.get("STATE_PATH", None)
-            if state_path_prefix is None:
-                state_path_prefix = "."
-            else:
-                os.makedirs(state_path_prefix, exist_ok=True)
-
-            db_path = (
-                f"sqlite:///{os.path.join(state_path_prefix, 'agent_session_state.db')}"
-            )
-            self.session = DatabaseSessionService(db_path)
-        elif session_type == SessionType.Firestore:
-            try:
-                self.session = FirestoreSessionService()
-                logger.info(
-                    f"Initialized Firestore service with config: {self.session}"
-                )
-            except Exception as e:
-                logger.error(f"Failed to initialize Firestore session service: {e}")
-                logger.warning("Falling back to InMemory session service")
-                self.session = InMemorySessionService()
-        else:
-            self.session = InMemorySessionService()
+        factory = _SESSION_FACTORIES.get(session_type, InMemorySessionService)
+        self.session = factory()
+        self._warm_task = None
+        # Known statically from the agent's output_schema: decides the final
+        # response handling without sniffing or exception-driven fallbacks.
+        self._expects_json = expects_json
+
+        self._session_cache: OrderedDict[
+            tuple[str, str, str], tuple[float, Session]
+        ] = OrderedDict()
+
+        # A per-instance memory service, and only when an agent in the tree
+        # actually carries the memory tool. The previous class-level instance
+        # was shared by every AgentRunner in the process and accumulated
+        # session refs for its entire lifetime.
+        self.memory = InMemoryMemoryService() if _agent_uses_memory(agent) else None
 
         self.runner = Runner(
             app_name=agent.name,
@@ -101,79 +241,133 @@ class AgentRunner:
             plugins=plugins,
         )
 
-    @retry(
-        retry=retry_if_exception_type(ValidationError),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=0.1, max=1),
-        reraise=True,
-    )
     async def stream(
         self, prompt: str, user_id: str, session_id: str
     ) -> AsyncGenerator[dict[str, Any], None]:
-        # ensure session exists
-        await self.get_or_create_session(
-            user_id=user_id, app_name=self.runner.app_name, session_id=session_id, user_prompt=prompt
+        """
+        Streams a turn, retrying up to three times on ValidationError with
+        exponential backoff. The retry loop lives here instead of a tenacity
+        decorator so the success path pays no wrapper bookkeeping; a stream
+        that already yielded chunks is never replayed.
+        """
+        for attempt in range(3):
+            yielded = False
+            try:
+                async for chunk in self._stream_impl(prompt, user_id, session_id):
+                    yielded = True
+                    yield chunk
+                return
+            except ValidationError:
+                if yielded or attempt == 2:
+                    raise
+                await asyncio.sleep(min(0.1 * 2**attempt, 1))
+
+    async def _stream_impl(
+        self, prompt: str, user_id: str, session_id: str
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        # ensure session exists, overlapping the round-trip with model warm-up
+        await asyncio.gather(
+            self.get_or_create_session(
+                user_id=user_id, app_name=self.runner.app_name, session_id=session_id, user_prompt=prompt
+            ),
+            self._warm_ready(),
         )
 
-        user_content = Content(role=ContentRoles.User.value, parts=[Part(text=prompt)])
+        user_content = _user_content(prompt)
 
-        streaming_mode = RunConfig(streaming_mode=StreamingMode.SSE)
+        events_since_sched = 0
 
         # You need a run config set to streaming mode to stream
         async for event in self.runner.run_async(
             user_id=user_id,
             session_id=session_id,
             new_message=user_content,
-            run_config=streaming_mode,
+            run_config=self._SSE_RUN_CONFIG,
         ):
-            if event.content and event.content.parts:
-                for part in event.content.parts:
-                    if hasattr(part, "function_call") and part.function_call:
-                        yield {
-                            "agent": event.author,
-                            "type": "function_call",
-                            "content": f"Running '{part.function_call.name}'...",
-                            "function_name": part.function_call.name,
-                            "lastResponse": False,
-                        }
+            # Evaluate the content/parts truthiness once per event and reuse
+            # it in both the streaming and final-response blocks below.
+            content = event.content
+            parts = content.parts if content else None
+
+            if parts:
+                # Consecutive text parts are coalesced into one chunk so an
+                # event with many small text parts costs one yield, not one
+                # per part; the buffer flushes whenever a tool part breaks
+                # the run of text.
+                text_buf: list[str] = []
+                for part in parts:
+                    # Handle regular text content (streaming tokens)
+                    if part.text and event.partial:
+                        text_buf.append(part.text)
+                        continue
 
-                    # Handle function responses
-                    elif hasattr(part, "function_response") and part.function_response:
-                        yield {
-                            "agent": event.author,
-                            "type": "function_response",
-                            "content": f"Finished running '{part.function_response.name}'.",
-                            "function_name": part.function_response.name,
-                            "lastResponse": False,
-                        }
+                    if text_buf:
+                        yield _text_chunk(event.author, text_buf)
+                        text_buf = []
 
-                    # Handle regular text content (streaming tokens)
-                    elif hasattr(part, "text") and part.text and event.partial:
-                        yield {
-                            "agent": event.author,
-                            "type": "text",
-                            "content": part.text,
-                            "function_name": None,
-                            "lastResponse": False,
-                        }
-
-            if event.is_final_response() and event.content and event.content.parts:
-                current_state = await self.get_current_session_state(
-                    app_name=self.runner.app_name,
-                    user_id=user_id,
-                    session_id=session_id,
+                    if part.function_call:
+                        chunk = _FUNCTION_CALL_TEMPLATE.copy()
+                        chunk["agent"] = event.author
+                        chunk["content"] = f"Running '{part.function_call.name}'..."
+                        chunk["function_name"] = part.function_call.name
+                        yield chunk
+
+                    # Handle function responses
+                    elif part.function_response:
+                        chunk = _FUNCTION_RESPONSE_TEMPLATE.copy()
+                        chunk["agent"] = event.author
+                        chunk["content"] = (
+                            f"Finished running '{part.function_response.name}'."
+                        )
+                        chunk["function_name"] = part.function_response.name
+                        yield chunk
+
+                if text_buf:
+                    yield _text_chunk(event.author, text_buf)
+
+            # When events arrive in bursts (already buffered by the model
+            # client), the yields above may never hit an awaiting point; give
+            # the loop a turn every few events to keep concurrent streams fair.
+            events_since_sched += 1
+            if events_since_sched >= self._EVENTS_PER_SCHED_POINT:
+                events_since_sched = 0
+                await asyncio.sleep(0)
+
+            if parts and event.is_final_response():
+                # Fire the state fetch now and await it only at yield time so
+                # the session-service round-trip overlaps response assembly
+                # instead of stalling the user-visible last chunk.
+                state_task = asyncio.create_task(
+                    self.get_current_session_state(
+                        app_name=self.runner.app_name,
+                        user_id=user_id,
+                        session_id=session_id,
+                    )
                 )
 
-                final_response_content = None
+                text0 = parts[0].text
                 response_type = "text"
-                if event.content and event.content.parts:
+                final_response_content = (
+                    (text0 or "")
+                    if len(parts) == 1
+                    else "".join(p.text for p in parts if p.text)
+                )
+                # Parse when the root agent carries an output_schema, and
+                # sniff otherwise: expects_json only describes the wrapped
+                # root agent, yet schema-bearing sub-agents in a workflow
+                # emit their JSON finals through this runner too. Always
+                # guarded — even a schema-backed final can arrive empty or
+                # malformed, and the text fallback beats killing the stream.
+                if self._expects_json or final_response_content[:1] in ("{", "["):
                     try:
-                        final_response_content = json.loads(event.content.parts[0].text)
-                        response_type = "json"
-                    except json.JSONDecodeError as e:
-                        final_response_content = "".join(
-                            [p.text for p in event.content.parts if p.text]
+                        final_response_content = orjson.loads(
+                            final_response_content
                         )
+                        response_type = "json"
+                    except orjson.JSONDecodeError:
+                        pass
+
+                current_state = await state_task
 
                 yield {
                     "agent": event.author,
@@ -184,22 +378,27 @@ class AgentRunner:
                     "state": current_state,
                 }
 
-    @mlflow.trace(span_type=SpanType.AGENT, name="agent_invoke")
     async def invoke(
         self, prompt: str, user_id: str, session_id: str = None
     ) -> List[dict]:
-        # ensure session exists
-        await self.get_or_create_session(user_id=user_id, app_name=self.runner.app_name, session_id=session_id, user_prompt=prompt)
+        # ensure session exists, overlapping the round-trip with model warm-up
+        await asyncio.gather(
+            self.get_or_create_session(user_id=user_id, app_name=self.runner.app_name, session_id=session_id, user_prompt=prompt),
+            self._warm_ready(),
+        )
         res = []
-        user_content = Content(role=ContentRoles.User.value, parts=[Part(text=prompt)])
+        user_content = _user_content(prompt)
         async for event in self.runner.run_async(
             user_id=user_id,
             session_id=session_id,
             new_message=user_content,
         ):
-            if event.content and event.content.parts:
-                for part in event.content.parts:
-                    if hasattr(part, "function_call") and part.function_call:
+            content = event.content
+            parts = content.parts if content else None
+
+            if parts:
+                for part in parts:
+                    if part.function_call:
                         logger.info(f"Function call: {part.function_call}")
                         res.append(
                             {
@@ -210,7 +409,7 @@ class AgentRunner:
                                 "done": False,
                             }
                         )
-                    elif hasattr(part, "function_response") and part.function_response:
+                    elif part.function_response:
                         logger.info(f"Function response: {part.function_response}")
                         res.append(
                             {
@@ -222,17 +421,20 @@ class AgentRunner:
                             }
                         )
 
-            if event.is_final_response() and event.content and event.content.parts:
-                final_response_content = ""
-                if event.content and event.content.parts:
-                    final_response_content = "".join(
-                        [p.text for p in event.content.parts if p.text]
+            if parts and event.is_final_response():
+                state_task = asyncio.create_task(
+                    self.get_current_session_state(
+                        app_name=self.runner.app_name,
+                        user_id=user_id,
+                        session_id=session_id,
                     )
-                current_state = await self.get_current_session_state(
-                    app_name=self.runner.app_name,
-                    user_id=user_id,
-                    session_id=session_id,
                 )
+                final_response_content = (
+                    (parts[0].text or "")
+                    if len(parts) == 1
+                    else "".join(p.text for p in parts if p.text)
+                )
+                current_state = await state_task
                 logger.info(f"Final response: {final_response_content}")
                 res.append(
                     {
@@ -263,6 +465,11 @@ class AgentRunner:
         :return: The retrieved or newly created session object.
         :rtype: Session
         """
+        key = (app_name, user_id, session_id)
+        cached = self._get_cached_session(key)
+        if cached is not None:
+            return cached
+
         session = await self.session.get_session(
             app_name=app_name, user_id=user_id, session_id=session_id
         )
@@ -270,6 +477,7 @@ class AgentRunner:
             session = await self.session.create_session(
                 app_name=app_name, user_id=user_id, session_id=session_id, state={"conversationTitle": user_prompt, "turn": 0}
             )
+        self._cache_session(key, session)
         return session
 
     async def get_current_session_state(
@@ -291,11 +499,82 @@ class AgentRunner:
         :return: The updated Session object if found, otherwise None.
         :rtype: Optional[Session]
         """
+        # State mutates while a turn runs, so always refetch here; the fresh
+        # session repopulates the cache for the next turn's existence check.
         session = await self.session.get_session(
             app_name=app_name, user_id=user_id, session_id=session_id
         )
+        if session:
+            self._cache_session((app_name, user_id, session_id), session)
         return session.state if session else {}
 
+    def _get_cached_session(self, key: tuple[str, str, str]) -> Optional[Session]:
+        """
+        Returns the cached session for ``key`` if it is still within the TTL,
+        otherwise evicts the stale entry and returns None.
+        """
+        entry = self._session_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self._SESSION_CACHE_TTL:
+            del self._session_cache[key]
+            return None
+        return entry[1]
+
+    def _cache_session(self, key: tuple[str, str, str], session: Session) -> None:
+        """
+        Stores ``session`` in the bounded LRU cache, evicting the oldest
+        entries once the cache exceeds its size limit.
+        """
+        cache = self._session_cache
+        cache[key] = (time.monotonic(), session)
+        cache.move_to_end(key)
+        while len(cache) > self._SESSION_CACHE_MAX:
+            cache.popitem(last=False)
+
+    def _warm_ready(self) -> "asyncio.Task":
+        """
+        Lazily starts the one-off model warm-up and returns its task so the
+        first turn can overlap it with the session-service round-trip.
+        Subsequent turns get the already-completed task back for free.
+        """
+        if self._warm_task is None:
+            self._warm_task = asyncio.get_running_loop().create_task(
+                self._warm_models(self.runner.agent)
+            )
+        return self._warm_task
+
+    @staticmethod
+    async def _warm_models(
+        agent: Agent | SequentialAgent | ParallelAgent | LoopAgent,
+    ) -> None:
+        """
+        Forces construction of every LiteLlm client in the agent tree ahead
+        of the first completion, so HTTP client / TLS context setup does not
+        land inside the first model call. No billable request is issued.
+        """
+        stack = [agent]
+        while stack:
+            node = stack.pop()
+            try:
+                model = getattr(node, "model", None)
+                if model is not None:
+                    getattr(model, "llm_client", None)
+            except Exception as e:
+                logger.debug("Model warm-up skipped for %s: %s", node, e)
+            stack.extend(getattr(node, "sub_agents", None) or [])
+            await asyncio.sleep(0)
+
+    def clear_memory(self) -> None:
+        """
+        Drops all stored memory, releasing the session references the
+        in-memory service accumulates over time. No-op for runners whose
+        agents never use the memory tool.
+        """
+        if self.memory is not None:
+            self.memory = InMemoryMemoryService()
+            self.runner.memory_service = self.memory
+
 
 class AbstractAgent(ABC):
     """
@@ -317,9 +596,16 @@ class AbstractAgent(ABC):
     :type _runner: AgentRunner
     """
 
-    _agent = None
-    config = None
-    _runner = None
+    __slots__ = (
+        "_agent",
+        "config",
+        "_runner",
+        "agent_type",
+        "_session_type",
+        "_plugins",
+        "model",
+        "_expects_json",
+    )
 
     def __init__(
         self,
@@ -339,16 +625,20 @@ class AbstractAgent(ABC):
         self.config = config
         self._session_type = session_type
         self._plugins = plugins
-        if not tools:
-            tools = []
+        self._runner = None
+        self._expects_json = output_schema is not None
+        # Copy instead of mutating: callers may share one tools list across
+        # several agents, and appending here grew it by one load_memory ref
+        # per constructed agent.
+        if include_memory_tool:
+            tools = [*(tools or ()), load_memory]
+        else:
+            tools = list(tools) if tools else []
 
         if not sub_agents:
             sub_agents = []
 
-        if include_memory_tool:
-            tools.append(load_memory)
-
-        self.model = LiteLlm(model=self.config.modelName)
+        self.model = _get_litellm(self.config.modelName)
 
         self._agent = Agent(
             name=self.config.name,
@@ -359,13 +649,30 @@ class AbstractAgent(ABC):
             tools=tools,
             output_schema=output_schema,
             output_key=self.config.outputKey,
-            before_model_callback=self._before_model_callback,
-            after_model_callback=self._after_model_callback,
-            before_tool_callback=self._before_tool_callback,
-            after_tool_callback=self._after_tool_callback,
+            before_model_callback=self._bound_callback("_before_model_callback"),
+            after_model_callback=self._bound_callback("_after_model_callback"),
+            before_tool_callback=self._bound_callback("_before_tool_callback"),
+            after_tool_callback=self._bound_callback("_after_tool_callback"),
             sub_agents=sub_agents,
         )
 
+    def _bound_callback(self, name: str):
+        """
+        Resolves the callback to register with the underlying Agent. The base
+        implementations only emit debug logs, so when a subclass has not
+        overridden them and debug logging is off, returning None keeps ADK
+        from dispatching into Python for a no-op on every turn and tool call.
+
+        :param name: Attribute name of the callback method.
+        :type name: str
+        :return: The bound callback, or None when it would be a silent no-op.
+        """
+        if getattr(type(self), name) is getattr(
+            AbstractAgent, name
+        ) and not logger.isEnabledFor(logging.DEBUG):
+            return None
+        return getattr(self, name)
+
     def _before_model_callback(
         self, callback_context: CallbackContext, llm_request: LlmRequest
     ) -> Optional[LlmResponse]:
@@ -388,7 +695,7 @@ class AbstractAgent(ABC):
             the language model. If no response is provided, the normal flow proceeds.
         :rtype: Optional[LlmResponse]
         """
-        logger.debug(f"Before Model Callback triggered: {callback_context.agent_name}")
+        logger.debug("Before Model Callback triggered: %s", callback_context.agent_name)
         return None
 
     def _after_model_callback(
@@ -413,7 +720,7 @@ class AbstractAgent(ABC):
             Returns `None` if no changes are applied.
         :rtype: Optional[LlmResponse]
         """
-        logger.debug(f"After Model Callback triggered: : {callback_context.agent_name}")
+        logger.debug("After Model Callback triggered: %s", callback_context.agent_name)
         return None
 
     def _before_tool_callback(
@@ -436,7 +743,9 @@ class AbstractAgent(ABC):
         :rtype: Optional[Dict]
         """
         logger.debug(
-            f"Before Tool Callback triggered for tool {tool.name}: {tool_context.agent_name}"
+            "Before Tool Callback triggered for tool %s: %s",
+            tool.name,
+            tool_context.agent_name,
         )
         return None
 
@@ -469,7 +778,9 @@ class AbstractAgent(ABC):
         :rtype: Optional[CallToolResult]
         """
         logger.debug(
-            f"After Tool Callback triggered for tool {tool.name}: {tool_context.agent_name}"
+            "After Tool Callback triggered for tool %s: %s",
+            tool.name,
+            tool_context.agent_name,
         )
         return None
 
@@ -503,6 +814,7 @@ class AbstractAgent(ABC):
                 agent=self._agent,
                 session_type=self._session_type,
                 plugins=self._plugins,
+                expects_json=self._expects_json,
             )
         return self._runner
 
@@ -526,8 +838,7 @@ class AbstractSequentialAgent(ABC):
     :type _runner: AgentRunner or None
     """
 
-    _agent = None
-    _runner = None
+    __slots__ = ("_agent", "_runner", "_session_type", "_plugins")
 
     def __init__(
         self,
@@ -537,6 +848,7 @@ class AbstractSequentialAgent(ABC):
         session_type: SessionType = SessionType.InMemory,
         plugins: Optional[List[BasePlugin]] = None,
     ) -> None:
+        self._runner = None
         self._session_type = session_type
         self._agent = SequentialAgent(
             name=name,
@@ -595,8 +907,7 @@ class AbstractLoopAgent(ABC):
     :type _runner: Any
     """
 
-    _agent = None
-    _runner = None
+    __slots__ = ("_agent", "_runner", "_session_type", "_plugins")
 
     def __init__(
         self,
@@ -621,6 +932,7 @@ class AbstractLoopAgent(ABC):
             LoopAgent. Defaults to 3.
         :type max_iterations: int
         """
+        self._runner = None
         self._plugins = plugins
         self._session_type = session_type
         self._agent = LoopAgent(
@@ -681,8 +993,7 @@ class AbstractParallelAgent(ABC):
     :type _runner: AgentRunner
     """
 
-    _agent = None
-    _runner = None
+    __slots__ = ("_agent", "_runner", "_session_type", "_plugins")
 
     def __init__(
         self,
@@ -692,6 +1003,7 @@ class AbstractParallelAgent(ABC):
         session_type: SessionType = SessionType.InMemory,
         plugins: Optional[List[BasePlugin]] = None,
     ) -> None:
+        self._runner = None
         self._session_type = session_type
         self._plugins = plugins
         self._agent = ParallelAgent(
@@ -711,3 +1023,17 @@ class AbstractParallelAgent(ABC):
                 agent=self._agent, session_type=self._session_type, plugins=self._plugins
             )
         return self._runner
+
+
+# Applied post hoc so the (slow, memory-heavy) mlflow import is only paid
+# when tracing is actually on; spans are then exported from a background
+# thread instead of serialising into the awaited coroutine.
+if _TRACE_ENABLED:
+    import mlflow
+
+    from mlflow.entities import SpanType
+
+    os.environ.setdefault("MLFLOW_ENABLE_ASYNC_TRACE_LOGGING", "true")
+    AgentRunner.invoke = mlflow.trace(span_type=SpanType.AGENT, name="agent_invoke")(
+        AgentRunner.invoke
+    )
@@ -6,21 +6,18 @@ from google.adk.agents.callback_context import CallbackContext
 from google.adk.models import LlmResponse
 
 from .abstract import AbstractAgent
-from .entities import AgentConfig, AgentType, SessionType
-from .utils import TokenUsage
-from ..config import ServiceConfig
+from .entities import AgentType, SessionType
+from .entities.config import _get_agent_config, _get_global_instruction
+from .utils import TokenAccountingMixin
 
 logger = logging.getLogger(__name__)
 
 
-class BusinessAnalyst(AbstractAgent):
+class BusinessAnalyst(TokenAccountingMixin, AbstractAgent):
     def __init__(self, session_type: SessionType = SessionType.InMemory) -> None:
-        service_config = ServiceConfig.get_or_create_instance()
-        base_agent_config = service_config.agents.get(AgentType.BusinessAnalyst.value)
-
         super().__init__(
             agent_type=AgentType.BusinessAnalyst,
-            config=AgentConfig(**base_agent_config),
-            global_instruction=service_config.globalInstruction,
+            config=_get_agent_config(AgentType.BusinessAnalyst),
+            global_instruction=_get_global_instruction(),
             session_type=session_type,
         )
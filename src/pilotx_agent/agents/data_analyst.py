@@ -1,5 +1,7 @@
+import functools
 import logging
-import json
+
+import orjson
 
 from typing import Dict, Any, Optional
 
@@ -11,34 +13,41 @@ from toolbox_core import ToolboxSyncClient
 
 from .abstract import AbstractAgent
 from .entities import (
-    AgentConfig,
     AgentType,
     SessionType,
     ToolResponse,
     VisualizationResponse,
 )
+from .entities.config import _get_agent_config, _get_global_instruction
 from .plugins import JailbreakDetector
-from .utils import TokenUsage, MlflowTracedSyncTool
+from .utils import TokenAccountingMixin, MlflowTracedSyncTool
 from ..config import ServiceConfig
 
 logger = logging.getLogger(__name__)
 
 
-class DataAnalyst(AbstractAgent):
-    def __init__(self, session_type: SessionType = SessionType.InMemory) -> None:
-        service_config = ServiceConfig.get_or_create_instance()
-        base_agent_config = service_config.agents.get(AgentType.DataAnalyst.value)
-        toolbox_config = service_config.toolbox
+@functools.lru_cache(maxsize=4)
+def _load_traced_tools(uri: str, toolset_id: str) -> tuple[MlflowTracedSyncTool, ...]:
+    """
+    Loads and wraps the toolbox toolset once per (uri, toolsetId). Every
+    DataAnalyst after the first reuses the same client and tools instead of
+    paying a fresh HTTP session plus load_toolset round-trip per construction.
+    """
+    toolbox = ToolboxSyncClient(uri)
+    return tuple(MlflowTracedSyncTool(t) for t in toolbox.load_toolset(toolset_id))
 
-        toolbox = ToolboxSyncClient(toolbox_config.get("uri"))
-        toolbox_tools = toolbox.load_toolset(toolbox_config.get("toolsetId"))
 
-        traced_tools = [MlflowTracedSyncTool(t) for t in toolbox_tools]
+class DataAnalyst(TokenAccountingMixin, AbstractAgent):
+    def __init__(self, session_type: SessionType = SessionType.InMemory) -> None:
+        toolbox_config = ServiceConfig.get_or_create_instance().toolbox
+        traced_tools = _load_traced_tools(
+            toolbox_config.get("uri"), toolbox_config.get("toolsetId")
+        )
 
         super().__init__(
             agent_type=AgentType.DataAnalyst,
-            config=AgentConfig(**base_agent_config),
-            global_instruction=service_config.globalInstruction,
+            config=_get_agent_config(AgentType.DataAnalyst),
+            global_instruction=_get_global_instruction(),
             tools=[*traced_tools],
             session_type=session_type,
             plugins=[JailbreakDetector()],
@@ -55,4 +64,13 @@ class DataAnalyst(AbstractAgent):
         logger.info(
             f"DataAnalyst: after_tool_callback invoked with tool_response: {tool_response}"
         )
+        # Toolbox tools occasionally hand back serialized JSON; deserialize
+        # it once here (orjson, C-level) so downstream consumers never parse
+        # twice. Non-JSON strings (plain-text results, error messages) pass
+        # through untouched.
+        if isinstance(tool_response, (bytes, str)):
+            try:
+                return orjson.loads(tool_response)
+            except orjson.JSONDecodeError:
+                return tool_response
         return tool_response
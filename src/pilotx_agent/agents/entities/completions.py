@@ -1,8 +1,20 @@
 from typing import Literal, Optional, List, Dict, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+__all__ = [
+    "VisualizationResponse",
+    "DataAnalystResponse",
+    "FAQ",
+    "FAQProposerResponse",
+    "TokenUsage",
+    "ErrorResponse",
+    "ToolResponse",
+]
 
 
 class VisualizationResponse(BaseModel):
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     visualizationType: Literal[
         "bar", "pie", "kpi", "line", "text"
     ] = Field(
@@ -32,12 +44,16 @@ class VisualizationResponse(BaseModel):
 
 
 class DataAnalystResponse(BaseModel):
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     data: List[VisualizationResponse] = Field(
         ..., description="List of visualizations."
     )
 
 
 class FAQ(BaseModel):
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     question: str = Field(..., description="Next Question")
     netInformationGainScore: float = Field(
         ...,
@@ -46,10 +62,14 @@ class FAQ(BaseModel):
 
 
 class FAQProposerResponse(BaseModel):
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     faqs: List[FAQ] = Field(..., description="List of FAQs of the json structure { \"question\": \"question\", \"netInformationGainScore\": 0.0 }")
 
 
 class TokenUsage(BaseModel):
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     prompt_tokens: int
     completion_tokens: int
     total_tokens: int
@@ -57,15 +77,18 @@ class TokenUsage(BaseModel):
 
 
 class ErrorResponse(BaseModel):
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     type: Literal["ErrorResponse"] = "ErrorResponse"
     error_description: str
 
 
 class ToolResponse(BaseModel):
+    model_config = ConfigDict(
+        extra="ignore", validate_assignment=False, arbitrary_types_allowed=True
+    )
+
     type: Literal["VisualizationResponse", "ErrorResponse"] = "VisualizationResponse"
     context: VisualizationResponse | ErrorResponse
     usage: Optional[TokenUsage]
     data: Optional[list[dict] | dict]
-
-    class Config:
-        arbitrary_types_allowed = True
@@ -1,10 +1,13 @@
+import functools
+import sys
+
 from enum import Enum
 from typing import Optional
 
 from pydantic import BaseModel
 
 
-class AgentType(Enum):
+class AgentType(str, Enum):
     DataAnalyst = "DataAnalyst"
     BusinessAnalyst = "BusinessAnalyst"
     FAQProposer = "FAQProposer"
@@ -20,13 +23,41 @@ class AgentConfig(BaseModel):
     baseUrl: Optional[str] = None
 
 
-class ContentRoles(Enum):
+@functools.lru_cache(maxsize=None)
+def _get_agent_config(agent_type: AgentType) -> AgentConfig:
+    """
+    Builds the AgentConfig for ``agent_type`` once per process. Agents are
+    reconstructed per workflow build, so memoizing here skips the repeated
+    ServiceConfig lookup and pydantic validation on every instantiation.
+    """
+    from ...config import ServiceConfig
+
+    service_config = ServiceConfig.get_or_create_instance()
+    # str-enum members hash like their values, so no .value hop is needed
+    return AgentConfig(**service_config.agents.get(agent_type))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_global_instruction() -> str:
+    """
+    Caches the shared global instruction string alongside the agent configs,
+    so every agent holds a reference to one object instead of keeping its own
+    copy of a multi-KB prompt alive. Short instructions are interned, making
+    later equality checks an identity comparison.
+    """
+    from ...config import ServiceConfig
+
+    instruction = ServiceConfig.get_or_create_instance().globalInstruction
+    return sys.intern(instruction) if len(instruction) <= 4096 else instruction
+
+
+class ContentRoles(str, Enum):
     User = "user"
     System = "system"
     Assistant = "assistant"
 
 
-class SessionType(Enum):
+class SessionType(str, Enum):
     InMemory = "in-memory"
     Database = "Database"
     VertexAI = "VertexAI"
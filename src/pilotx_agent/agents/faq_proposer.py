@@ -6,23 +6,20 @@ from google.adk.agents.callback_context import CallbackContext
 from google.adk.models import LlmResponse
 
 from .abstract import AbstractAgent
-from .entities import AgentConfig, AgentType, SessionType
-from .utils import TokenUsage
-from ..config import ServiceConfig
+from .entities import AgentType, SessionType
+from .entities.config import _get_agent_config, _get_global_instruction
+from .utils import TokenAccountingMixin
 from .entities.completions import FAQProposerResponse
 
 logger = logging.getLogger(__name__)
 
 
-class FAQProposer(AbstractAgent):
+class FAQProposer(TokenAccountingMixin, AbstractAgent):
     def __init__(self, session_type: SessionType = SessionType.InMemory) -> None:
-        service_config = ServiceConfig.get_or_create_instance()
-        base_agent_config = service_config.agents.get(AgentType.FAQProposer.value)
-
         super().__init__(
             agent_type=AgentType.FAQProposer,
-            config=AgentConfig(**base_agent_config),
-            global_instruction=service_config.globalInstruction,
+            config=_get_agent_config(AgentType.FAQProposer),
+            global_instruction=_get_global_instruction(),
             session_type=session_type,
             output_schema=FAQProposerResponse,
         )
@@ -5,8 +5,8 @@ from google.adk.agents.callback_context import CallbackContext
 from google.adk.models import LlmResponse
 
 from .abstract import AbstractAgent
-from .entities import AgentConfig, AgentType, SessionType
-from ..config import ServiceConfig
+from .entities import AgentType, SessionType
+from .entities.config import _get_agent_config, _get_global_instruction
 from .workflow import InsightsWorkflowAgent
 
 logger = logging.getLogger(__name__)
@@ -14,13 +14,14 @@ logger = logging.getLogger(__name__)
 
 class Orchestrator(AbstractAgent):
     def __init__(self, session_type: SessionType = SessionType.InMemory) -> None:
-        service_config = ServiceConfig.get_or_create_instance()
-        base_agent_config = service_config.agents.get(AgentType.Orchestrator.value)
-
+        # The workflow must be built per Orchestrator: ADK agents track their
+        # parent, so sharing one InsightsWorkflow instance across orchestrators
+        # fails parent validation. Construction stays cheap via the cached
+        # agent configs and toolset.
         super().__init__(
             agent_type=AgentType.Orchestrator,
-            config=AgentConfig(**base_agent_config),
-            global_instruction=service_config.globalInstruction,
+            config=_get_agent_config(AgentType.Orchestrator),
+            global_instruction=_get_global_instruction(),
             session_type=session_type,
             sub_agents=[InsightsWorkflowAgent(session_type=session_type).agent],
         )
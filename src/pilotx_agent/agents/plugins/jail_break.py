@@ -17,6 +17,10 @@ class JailbreakDetector(BasePlugin):
     async def on_user_message_callback(
         self, *, invocation_context: InvocationContext, user_message: types.Content
     ) -> Optional[types.Content]:
-        logger.info(
-            f"JailbreakDetector: on_user_message_callback invoked with user_message: {user_message}"
-        )
+        # Guard before formatting: stringifying a full Content per message is
+        # pure waste whenever INFO is suppressed.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "JailbreakDetector: on_user_message_callback invoked with user_message: %s",
+                user_message,
+            )
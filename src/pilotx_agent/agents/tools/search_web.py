@@ -1,3 +1,4 @@
+import functools
 import os
 from tavily import TavilyClient
 from tenacity import retry, stop_after_attempt, wait_fixed
@@ -8,6 +9,15 @@ from ...utils import EnvironmentVariableNotFound
 TAVILY_API_KEY = os.getenv("TAVILY_API_KEY", None)
 
 
+@functools.lru_cache(maxsize=1)
+def _tavily_client() -> TavilyClient:
+    """
+    Builds the Tavily client once so queries (and retries) reuse its HTTPS
+    session instead of paying a TCP/TLS handshake per call.
+    """
+    return TavilyClient(api_key=TAVILY_API_KEY)
+
+
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_fixed(2),
@@ -33,8 +43,7 @@ def search_web_for_latest_information(query: str, max_results: int = 3) -> dict:
     """
     if TAVILY_API_KEY is None:
         raise EnvironmentVariableNotFound("TAVILY_API_KEY")
-    tavily_client = TavilyClient(api_key=TAVILY_API_KEY)
-    response = tavily_client.search(
+    response = _tavily_client().search(
         query=query,
         max_results=max_results,
         include_answer=True,
@@ -1,5 +1,6 @@
 from .cost_estimator import TokenUsage
+from .token_accounting import TokenAccountingMixin
 from .tool_wrapper import MlflowTracedSyncTool
 
 
-__all__ = ["TokenUsage", "MlflowTracedSyncTool"]
+__all__ = ["TokenUsage", "TokenAccountingMixin", "MlflowTracedSyncTool"]
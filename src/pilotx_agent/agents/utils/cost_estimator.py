@@ -1,4 +1,17 @@
+# Default gpt-4o-mini style pricing, folded down to per-token rates so the
+# per-turn hot path multiplies instead of dividing by 1e6 twice.
+_COST_IN = 0.15 / 1e6
+_COST_OUT = 0.60 / 1e6
+
+# 128k context with a 10% safety buffer, precomputed once.
+_USABLE_CTX = 128000 * 0.9
+
+
 class TokenUsage:
+    # Pure namespace of staticmethods; empty slots drop the per-instance
+    # dict and block accidental attribute assignment.
+    __slots__ = ()
+
     @staticmethod
     def compute_token_cost(
         prompt_tokens: int,
@@ -12,19 +25,25 @@ class TokenUsage:
         Args:
             prompt_tokens (int): Number of tokens in the prompt.
             completion_tokens (int): Number of tokens in the completion.
-            cost_per_1m_input_tok (float): Cost per 1 million input tokens. Default is $0.1.
-            cost_per_1m_output_tok (float): Cost per 1 million output tokens. Default is $0.2.
+            cost_per_1m_input_tok (float): Cost per 1 million input tokens. Default is $0.15.
+            cost_per_1m_output_tok (float): Cost per 1 million output tokens. Default is $0.60.
 
         Returns:
             float: Estimated cost.
         """
-        input_cost = (prompt_tokens / 1e6) * cost_per_1m_input_tok
-        output_cost = (completion_tokens / 1e6) * cost_per_1m_output_tok
-        total_cost = input_cost + output_cost
-        return total_cost, input_cost, output_cost
+        if cost_per_1m_input_tok == 0.15 and cost_per_1m_output_tok == 0.60:
+            # Default pricing: use the precomputed per-token rates
+            input_cost = prompt_tokens * _COST_IN
+            output_cost = completion_tokens * _COST_OUT
+        else:
+            input_cost = (prompt_tokens / 1e6) * cost_per_1m_input_tok
+            output_cost = (completion_tokens / 1e6) * cost_per_1m_output_tok
+        return input_cost + output_cost, input_cost, output_cost
 
     @staticmethod
     def get_used_context_length(
-        total_tokens, max_context_length: int = 128000, buffer: int = 0.1
+        total_tokens, max_context_length: int = 128000, buffer: float = 0.1
     ) -> float:
+        if max_context_length == 128000 and buffer == 0.1:
+            return round(total_tokens / _USABLE_CTX, 4)
         return round(total_tokens / (max_context_length * (1 - buffer)), 4)
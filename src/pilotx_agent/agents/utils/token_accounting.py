@@ -0,0 +1,81 @@
+import logging
+
+from typing import Optional
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmResponse
+
+from .cost_estimator import TokenUsage
+
+logger = logging.getLogger(__name__)
+
+# Zeroed accumulator shape, copied (C-level) for the first turn of each
+# conversation instead of re-evaluating a dict literal in the callback.
+_EMPTY_CONV_USAGE = {
+    "totalCost": 0.0,
+    "totalInputCost": 0.0,
+    "totalOutputCost": 0.0,
+    "totalTokens": 0,
+}
+
+
+class TokenAccountingMixin:
+    """
+    Mixin providing the shared per-turn token accounting callback for agents.
+
+    Keeping a single implementation means every agent class inherits one
+    compiled function object instead of carrying its own verbatim copy.
+    """
+
+    def _record_turn_usage(
+        self,
+        callback_context: CallbackContext,
+        llm_response: LlmResponse,
+        # Bound at definition time so the per-turn body resolves them as
+        # LOAD_FAST locals instead of global + attribute lookups.
+        _compute_cost=TokenUsage.compute_token_cost,
+        _used_context=TokenUsage.get_used_context_length,
+        _empty_conv_usage=_EMPTY_CONV_USAGE,
+    ) -> Optional[LlmResponse]:
+        usage = llm_response.usage_metadata
+        if usage is None:
+            return None
+
+        input_tokens = usage.prompt_token_count or 0
+        output_tokens = usage.candidates_token_count or 0
+        total_tokens = usage.total_token_count or (input_tokens + output_tokens)
+
+        turn_cost, input_cost, output_cost = _compute_cost(
+            input_tokens, output_tokens
+        )
+
+        # Build locally and assign once: every read/write through the ADK
+        # State wrapper does delta bookkeeping, so the arithmetic below works
+        # on plain locals and dicts instead.
+        state = callback_context.state
+        turn_usage = {
+            "turnCost": turn_cost,
+            "inputCost": input_cost,
+            "outputCost": output_cost,
+            "totalTokens": total_tokens,
+            "turnInputTokens": input_tokens,
+            "turnOutputTokens": output_tokens,
+            "contextUsed": _used_context(total_tokens),
+        }
+
+        conv_usage = state.get("app:convUsage") or _empty_conv_usage.copy()
+        conv_usage["totalCost"] += turn_cost
+        conv_usage["totalInputCost"] += input_cost
+        conv_usage["totalOutputCost"] += output_cost
+        conv_usage["totalTokens"] += total_tokens
+
+        # One batched delta through the State wrapper instead of a prefix
+        # classification per key write.
+        state.update({"turnUsage": turn_usage, "app:convUsage": conv_usage})
+
+        return None
+
+    def _after_model_callback(
+        self, callback_context: CallbackContext, llm_response: LlmResponse
+    ) -> Optional[LlmResponse]:
+        return self._record_turn_usage(callback_context, llm_response)
@@ -1,24 +1,47 @@
+import inspect
+import os
+import random
+
 import mlflow
 from mlflow.entities import SpanType
 
+# Tool spans stay on by default; set MLFLOW_TRACING_ENABLED=false to bypass
+# span bookkeeping entirely, or MLFLOW_TRACE_SAMPLE below 1.0 to trace only
+# a fraction of tool calls on high-QPS agents.
+_TRACING_ENABLED = os.getenv("MLFLOW_TRACING_ENABLED", "true").lower() not in (
+    "0",
+    "false",
+)
+_SAMPLE = float(os.getenv("MLFLOW_TRACE_SAMPLE", "1.0"))
+
 
 class MlflowTracedSyncTool:
     """Wraps a ToolboxSyncTool (or any callable) and adds an MLflow TOOL span."""
 
+    __slots__ = ("_inner", "name", "description", "__signature__")
+
     def __init__(self, inner):
-        # Use object.__setattr__ to avoid recursion with __setattr__ / __getattr__
-        object.__setattr__(self, "_inner", inner)
+        self._inner = inner
+        # Snapshot the attributes the ADK framework probes on every tool
+        # dispatch, so they resolve as direct slots instead of taking the
+        # __getattr__ trampoline per access.
+        self.name = getattr(inner, "_name", None) or type(inner).__name__
+        self.description = getattr(inner, "description", None) or (inner.__doc__ or "")
+        try:
+            self.__signature__ = inspect.signature(inner)
+        except (TypeError, ValueError):
+            self.__signature__ = None
 
     def __getattr__(self, name):
-        # Delegate everything we don't override to the inner tool
-        return getattr(self._inner, name)
-
-    @property
-    def name(self) -> str:
-        return self._inner._name
+        # Cold path: anything not snapshotted above still reaches the inner tool
+        return getattr(object.__getattribute__(self, "_inner"), name)
 
     def __call__(self, *args, **kwargs):
-        # Try to get a nice name; fall back to class name
+        # Fast path: skip span allocation, timestamping and output capture
+        # when tracing is off or this call is not sampled.
+        if not _TRACING_ENABLED or (_SAMPLE < 1.0 and random.random() > _SAMPLE):
+            return self._inner(*args, **kwargs)
+
         tool_name = self.name
 
         with mlflow.start_span(
@@ -38,4 +61,4 @@ class MlflowTracedSyncTool:
             # Capture outputs if you want them visible in the trace
             span.set_outputs({"result": result})
 
-            return result
\ No newline at end of file
+            return result
@@ -1,56 +1,90 @@
+import hashlib
 import logging
+import threading
+import time
+
+from collections import OrderedDict
+
 import firebase_admin as fba
 from firebase_admin import auth
 from a2a.server.agent_execution import RequestContext
 
-from ..utils import AuthorisationTokenMissing, UnableToAuthenticateToken
+from ..utils import UnableToAuthenticateToken
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared missing-token response; every early return copies this instead of
+# raising and catching AuthorisationTokenMissing just to build the same dict.
+_AUTH_MISSING_RESP = {
+    "type": "auth_error",
+    "context": "[ASE:005] Authorization token in header is missing",
+    "statusCode": 401,
+}
+
+
+# Verified-token cache: verify_id_token performs a synchronous RSA/JWK
+# verification costing milliseconds per request. Decoded tokens are cached
+# under a sha256 digest (stable across workers, unlike Python's seeded hash)
+# until the earlier of the token's own exp and a 5-minute ceiling, bounded
+# LRU-style at 10k entries.
+_TOKEN_CACHE: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+_TOKEN_CACHE_LOCK = threading.Lock()
+_TOKEN_CACHE_MAX = 10_000
+_TOKEN_CACHE_MAX_TTL = 300.0
+
+
+def _verify_id_token_cached(token: str) -> dict:
+    key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+    with _TOKEN_CACHE_LOCK:
+        entry = _TOKEN_CACHE.get(key)
+        if entry is not None and entry[0] > now:
+            _TOKEN_CACHE.move_to_end(key)
+            return entry[1]
+
+    decoded_token = auth.verify_id_token(token)
+
+    expires = min(float(decoded_token.get("exp", now)), now + _TOKEN_CACHE_MAX_TTL)
+    if expires > now:
+        with _TOKEN_CACHE_LOCK:
+            _TOKEN_CACHE[key] = (expires, decoded_token)
+            _TOKEN_CACHE.move_to_end(key)
+            while len(_TOKEN_CACHE) > _TOKEN_CACHE_MAX:
+                _TOKEN_CACHE.popitem(last=False)
+    return decoded_token
+
 
 class PilotXBackend:
+    # All state lives at class level (_instance, app); empty slots keep
+    # instances dict-free should one ever be constructed.
+    __slots__ = ()
+
     _instance = None
     app = fba.initialize_app()
 
     @staticmethod
     async def authenticate(context: RequestContext):
+        # Flat short-circuit checks: a missing header is the common
+        # unauthenticated path and should cost a few branches, not an
+        # exception raise/unwind per request.
+        call_context = context.call_context
+        state = call_context.state if call_context else None
+        headers = state.get("headers") if state else None
+        token = headers.get("authorization") if headers else None
+        if not token:
+            return False, _AUTH_MISSING_RESP.copy()
+
         try:
-            if context.call_context and context.call_context.state:
-                if context.call_context.state.get("headers", None) is not None:
-                    headers = context.call_context.state["headers"]
-                    if headers.get("authorization", None) is not None:
-                        token = headers["authorization"]
-                        if token:
-                            token = token.replace("Bearer ", "")
-                            try:
-                                decoded_token = auth.verify_id_token(token)
-                                return True, {
-                                    "type": "auth_success",
-                                    "context": "Authenticated Successfully",
-                                    **decoded_token,
-                                }
-                            except Exception as e:
-                                raise UnableToAuthenticateToken(str(e))
-                        else:
-                            raise AuthorisationTokenMissing()
-                    else:
-                        raise AuthorisationTokenMissing()
-                else:
-                    raise AuthorisationTokenMissing()
-            else:
-                raise AuthorisationTokenMissing()
-        except AuthorisationTokenMissing as atme:
-            return False, {
-                "type": "auth_error",
-                "context": atme.message,
-                "statusCode": 401,
+            decoded_token = _verify_id_token_cached(token.removeprefix("Bearer "))
+            return True, {
+                "type": "auth_success",
+                "context": "Authenticated Successfully",
+                **decoded_token,
             }
-        except UnableToAuthenticateToken as uate:
+        except Exception as e:
             return False, {
                 "type": "auth_error",
-                "context": uate.message,
+                "context": UnableToAuthenticateToken(str(e)).message,
                 "statusCode": 401,
             }
-        except Exception as e:
-            return False, {"type": "auth_error", "context": str(e), "statusCode": 401}
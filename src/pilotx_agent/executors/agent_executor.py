@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 import uuid
@@ -17,7 +18,6 @@ from a2a.types import (
 )
 from a2a.utils import new_task, new_agent_text_message
 from google.adk.agents import SequentialAgent, ParallelAgent, LoopAgent
-from google.protobuf import struct_pb2 as _struct_pb2
 from litellm import ContextWindowExceededError
 
 from ..agents.abstract import AbstractAgent, AbstractSequentialAgent
@@ -26,6 +26,16 @@ from ..utils import ExceededContextLength, UnauthorisedRequest
 
 logger = logging.getLogger(__name__)
 
+# Partial-event metadata template; per chunk we copy and fill in the
+# variable fields instead of rebuilding a protobuf Struct per token.
+_PARTIAL_METADATA_TEMPLATE = {
+    "type": "text",
+    "lastResponse": False,
+    "turnComplete": False,
+    "agent": "",
+    "function_name": None,
+}
+
 
 class PilotXAgentExecutor(AgentExecutor):
     """Generic Agent Executor that can work with any agent implementing AbstractAgent."""
@@ -45,6 +55,92 @@ class PilotXAgentExecutor(AgentExecutor):
         self.agent = agent
         self.streaming = streaming
 
+    async def _drain_events(
+        self,
+        q: asyncio.Queue,
+        task,
+        updater: TaskUpdater,
+        event_queue: EventQueue,
+    ) -> None:
+        """Ship queued agent events downstream until a ``None`` sentinel."""
+        try:
+            await self._dispatch_events(q, task, updater, event_queue)
+        except Exception:
+            # Keep consuming until the sentinel so the producer can never
+            # block on a full queue behind a dead sender; the original
+            # failure re-raises once the stream side is done feeding us.
+            while await q.get() is not None:
+                pass
+            raise
+
+    async def _dispatch_events(
+        self,
+        q: asyncio.Queue,
+        task,
+        updater: TaskUpdater,
+        event_queue: EventQueue,
+    ) -> None:
+        while True:
+            event = await q.get()
+            if event is None:
+                return
+            if not event["content"]:
+                continue
+            if event["lastResponse"]:
+                if event["type"] == "text":
+                    message = new_agent_text_message(
+                        text=event["content"],
+                        context_id=task.context_id,
+                        task_id=task.id,
+                    )
+                elif event["type"] == "json":
+                    message = Message(
+                        role=Role.agent,
+                        parts=[Part(root=DataPart(data=event["content"]))],
+                        message_id=uuid.uuid4().hex,
+                        task_id=task.id,
+                        context_id=task.context_id,
+                    )
+                metadata = {
+                    "type": event["type"],
+                    "turnComplete": False,
+                    "lastResponse": event["lastResponse"],
+                    "agent": event["agent"],
+                }
+                await updater.update_status(
+                    TaskState.working, message=message, metadata=metadata
+                )
+            else:
+                # This is a partial/streaming response
+                metadata = _PARTIAL_METADATA_TEMPLATE.copy()
+                metadata["type"] = event["type"]
+                metadata["lastResponse"] = event["lastResponse"]
+                metadata["agent"] = event["agent"]
+                metadata["function_name"] = event["function_name"]
+                if event["type"] == "json":
+                    parts = [DataPart(data=event["content"])]
+                else:
+                    parts = [TextPart(text=event["content"])]
+
+                await event_queue.enqueue_event(
+                    TaskStatusUpdateEvent(
+                        status=TaskStatus(
+                            state=TaskState.working,
+                            message=Message(
+                                role=Role.agent,
+                                parts=parts,
+                                message_id=uuid.uuid4().hex,
+                                task_id=task.id,
+                                context_id=task.context_id,
+                                metadata=metadata,
+                            ),
+                        ),
+                        final=False,
+                        context_id=task.context_id,
+                        task_id=task.id,
+                    )
+                )
+
     async def execute(
         self, context: RequestContext, event_queue: EventQueue, streaming: bool = None
     ) -> None:
@@ -66,78 +162,52 @@ class PilotXAgentExecutor(AgentExecutor):
                     raise UnauthorisedRequest(user_info["context"])
 
             if auth_success and user_id:
-                async for event in self.agent.runner.stream(
-                    prompt=query, user_id=user_id, session_id=task.context_id
-                ):
-                    if event["content"]:
-                        if event["lastResponse"]:
-                            if event["type"] == "text":
-                                message = new_agent_text_message(
-                                    text=event["content"],
-                                    context_id=task.context_id,
-                                    task_id=task.id,
-                                )
-                            elif event["type"] == "json":
-                                message = Message(
-                                    role=Role.agent,
-                                    parts=[Part(root=DataPart(data=event["content"]))],
-                                    message_id=str(uuid.uuid4()),
-                                    task_id=task.id,
-                                    context_id=task.context_id,
-                                )
-                            metadata = {
-                                "type": event["type"],
-                                "turnComplete": False,
-                                "lastResponse": event["lastResponse"],
-                                "agent": event["agent"],
-                            }
-                            await updater.update_status(
-                                TaskState.working, message=message, metadata=metadata
-                            )
-                        else:
-                            # This is a partial/streaming response
-                            metadata = _struct_pb2.Struct()
-                            metadata.update(
-                                {
-                                    "type": event["type"],
-                                    "lastResponse": event["lastResponse"],
-                                    "turnComplete": False,
-                                    "agent": event["agent"],
-                                    "function_name": event["function_name"],
-                                }
-                            )
-                            if event["type"] == "json":
-                                parts = [DataPart(data=event["content"])]
-                            else:
-                                parts = [TextPart(text=event["content"])]
-
-                            await event_queue.enqueue_event(
-                                TaskStatusUpdateEvent(
-                                    status=TaskStatus(
-                                        state=TaskState.working,
-                                        message=Message(
-                                            role=Role.agent,
-                                            parts=parts,
-                                            message_id=str(uuid.uuid4()),
-                                            task_id=task.id,
-                                            context_id=task.context_id,
-                                            metadata=metadata,
-                                        ),
-                                    ),
-                                    final=False,
-                                    context_id=task.context_id,
-                                    task_id=task.id,
-                                )
-                            )
+                # Decouple the LLM stream from the downstream sink: a slow
+                # enqueue/update no longer stalls the next model chunk. The
+                # bounded queue applies back-pressure if the sink falls far
+                # behind.
+                q: asyncio.Queue = asyncio.Queue(maxsize=64)
+                sender_task = asyncio.create_task(
+                    self._drain_events(q, task, updater, event_queue)
+                )
+                state_task = None
+                try:
+                    async for event in self.agent.runner.stream(
+                        prompt=query, user_id=user_id, session_id=task.context_id
+                    ):
+                        # A failing sender keeps draining the queue until the
+                        # sentinel, so this put cannot block indefinitely.
+                        await q.put(event)
+                    # Overlap the final state read with draining the last
+                    # queued updates instead of paying for it serially.
+                    state_task = asyncio.create_task(
+                        self.agent.runner.get_current_session_state(
+                            app_name=self.agent.runner.runner.app_name,
+                            user_id=user_id,
+                            session_id=task.context_id,
+                        )
+                    )
+                finally:
+                    try:
+                        if not sender_task.done():
+                            await q.put(None)
+                        await sender_task
+                    except BaseException:
+                        # Don't orphan the state fetch on the error path.
+                        if state_task is not None:
+                            state_task.cancel()
+                        raise
 
                 message = new_agent_text_message(
                     text="done",
                     context_id=task.context_id,
                     task_id=task.id,
                 )
-                state = await self.agent.runner.get_current_session_state(
-                    app_name=self.agent.runner.runner.app_name, user_id=user_id, session_id=task.context_id
-                )
+                try:
+                    state = await state_task
+                except Exception:
+                    # A failed state fetch shouldn't kill the completed turn.
+                    state = {}
                 state = {
                     **state,
                     "type": "status",
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import itertools
 import logging
 import os
-import pickle
+import time
 
+import orjson
+import zstandard
+
+from collections import OrderedDict
 from datetime import datetime, timezone, timedelta
 from typing import Any, Dict, Optional
 from uuid import uuid4
@@ -16,8 +22,9 @@ from google.adk.sessions.base_session_service import (
     ListSessionsResponse,
 )
 from google.adk.sessions.session import Session
-from google.cloud.firestore_v1 import AsyncClient
+from google.cloud.firestore_v1 import AsyncClient, Query
 from google.cloud.firestore_v1.base_query import FieldFilter
+from pydantic_core import to_jsonable_python
 from typing_extensions import override
 
 from ..config import ServiceConfig
@@ -25,14 +32,97 @@ from ..config import ServiceConfig
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Firestore caps a WriteBatch at 500 operations; commits run concurrently
+# but bounded so a huge session delete can't flood the client.
+_DELETE_BATCH_SIZE = 500
+_DELETE_CONCURRENCY = 8
+
+# Page size for list_sessions; keeps each RPC's response bounded.
+_LIST_PAGE_SIZE = 500
+
+# Retention applied to session docs and their event docs. Firestore's
+# native TTL policy can expire both server-side, but it does not cascade
+# into subcollections, so events carry their own ttl field. One-time setup:
+#   gcloud firestore fields ttls update ttl --collection-group=<sessions collection>
+#   gcloud firestore fields ttls update ttl --collection-group=events
+_SESSION_TTL = timedelta(days=180)
+
+# Bound on the per-service document-reference cache (see _refs_for).
+_DOC_CACHE_MAX = 1024
+
+# In-process session cache: the orchestrator re-reads a session it wrote
+# moments earlier on every turn; a short TTL keeps those reads local while
+# bounding staleness for writes from other processes.
+_SESSION_CACHE_TTL = 30.0
+_SESSION_CACHE_MAX = 256
+
+# Payloads whose JSON form exceeds this many bytes are stored zstd-compressed
+# (Firestore bills per byte and caps documents at 1 MiB). The codecs carry
+# C-side context that is expensive to set up, so build them once; all use is
+# on the event loop thread, so sharing them is safe.
+_COMPRESS_THRESHOLD = 16_000
+_ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=3)
+_ZSTD_DECOMPRESSOR = zstandard.ZstdDecompressor()
+
+# Fields _doc_to_event actually consumes; projecting these keeps the
+# per-session app_name/user_id/session_id copies out of every read.
+_EVENT_FIELDS = [
+    "id",
+    "invocation_id",
+    "author",
+    "branch",
+    "timestamp",
+    "content",
+    "content_zstd",
+    "actions",
+    "long_running_tool_ids",
+    "grounding_metadata",
+    "grounding_metadata_zstd",
+    "partial",
+    "turn_complete",
+    "error_code",
+    "error_message",
+    "interrupted",
+]
+
 
 def _now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _persistent_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    """State without ``temp:`` keys; skips the dict rebuild when none exist.
+
+    The common case has no temp keys, so one C-level key scan replaces the
+    per-event comprehension that re-copied the whole state. The returned
+    dict is only serialized, never mutated, so aliasing the input is safe.
+    """
+    if any(k.startswith("temp:") for k in state):
+        return {k: v for k, v in state.items() if not k.startswith("temp:")}
+    return state
+
+
+def _maybe_compress(payload: Dict[str, Any] | None) -> tuple[Any, bytes | None]:
+    """Return (plain payload, compressed bytes); exactly one side is set."""
+    if payload is None:
+        return None, None
+    raw = orjson.dumps(payload)
+    if len(raw) <= _COMPRESS_THRESHOLD:
+        return payload, None
+    return None, _ZSTD_COMPRESSOR.compress(raw)
+
+
+def _maybe_decompress(plain: Any, compressed: Any) -> Any:
+    if plain is not None or not compressed:
+        return plain
+    return orjson.loads(_ZSTD_DECOMPRESSOR.decompress(bytes(compressed)))
+
+
 def _safe_model_dump(obj) -> Dict[str, Any] | None:
+    # to_jsonable_python runs the serializer in pydantic-core's Rust layer,
+    # skipping model_dump(mode="json")'s Python-level field walk.
     try:
-        return obj.model_dump(exclude_none=True, mode="json")  # type: ignore[attr-defined]
+        return to_jsonable_python(obj, exclude_none=True)
     except Exception:
         return None
 
@@ -43,8 +133,32 @@ class FirestoreSessionService(BaseSessionService):
         config = ServiceConfig.get_or_create_instance()
         if not os.getenv("GOOGLE_APPLICATION_CREDENTIALS"):
             logger.info("GOOGLE_APPLICATION_CREDENTIALS not set; relying on ADC.")
-        self.client: AsyncClient = AsyncClient(database=config.firebase["database"])
-        self.col_sessions = self.client.collection(config.firebase["collection"])
+        # Each AsyncClient owns its own gRPC channel; a small pool spreads
+        # concurrent session streams across channels instead of multiplexing
+        # everything over one. Defaults to the original single-client setup.
+        pool_size = max(1, int(os.getenv("FIRESTORE_CLIENT_POOL_SIZE", "1")))
+        self._clients: list[AsyncClient] = [
+            AsyncClient(database=config.firebase["database"])
+            for _ in range(pool_size)
+        ]
+        self._rr = itertools.count()
+        self._collection_name = config.firebase["collection"]
+        self.client: AsyncClient = self._clients[0]
+        self.col_sessions = self.client.collection(self._collection_name)
+        # With a native TTL policy registered (see _SESSION_TTL above),
+        # delete_session collapses to a single update RPC and lets Firestore
+        # sweep the documents server-side.
+        self._ttl_policy_enabled = bool(config.firebase.get("ttlPolicyEnabled"))
+        # (app, user, sid) -> (session doc ref, events collection ref); hot
+        # sessions resolve one reference per event append, so skip rebuilding
+        # the path string and re-parsing it each time.
+        self._doc_cache: OrderedDict[
+            tuple[int, str, str, str], tuple[Any, Any]
+        ] = OrderedDict()
+        # (app, user, sid) -> (monotonic deadline, fully-loaded Session)
+        self._session_cache: OrderedDict[
+            tuple[str, str, str], tuple[float, Session]
+        ] = OrderedDict()
         logger.info(
             "FirestoreSessionService initialised (project=%s)", self.client.project
         )
@@ -56,6 +170,47 @@ class FirestoreSessionService(BaseSessionService):
     def _generate_id() -> str:
         return uuid4().hex
 
+    def _pick_client_idx(self) -> int:
+        """Round-robin index into the client pool (always 0 for pool size 1)."""
+        clients = self._clients
+        if len(clients) == 1:
+            return 0
+        return next(self._rr) % len(clients)
+
+    def _refs_for(self, app_name: str, user_id: str, session_id: str, client_idx: int = 0):
+        """Cached (doc_ref, events_col) pair for a session, LRU-bounded."""
+        key = (client_idx, app_name, user_id, session_id)
+        cache = self._doc_cache
+        refs = cache.get(key)
+        if refs is None:
+            doc_ref = self._clients[client_idx].collection(
+                self._collection_name
+            ).document(f"{app_name}:{user_id}:{session_id}")
+            refs = (doc_ref, doc_ref.collection("events"))
+            cache[key] = refs
+            if len(cache) > _DOC_CACHE_MAX:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return refs
+
+    def _cached_session(self, key: tuple[str, str, str]) -> Optional[Session]:
+        entry = self._session_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._session_cache[key]
+            return None
+        self._session_cache.move_to_end(key)
+        return entry[1]
+
+    def _cache_session(self, key: tuple[str, str, str], session: Session) -> None:
+        cache = self._session_cache
+        cache[key] = (time.monotonic() + _SESSION_CACHE_TTL, session)
+        cache.move_to_end(key)
+        while len(cache) > _SESSION_CACHE_MAX:
+            cache.popitem(last=False)
+
     @override
     async def create_session(
         self,
@@ -68,13 +223,8 @@ class FirestoreSessionService(BaseSessionService):
         now = _now_utc()
         # Use provided session_id or generate one
         sid = session_id or self._generate_id()
-        doc_ref = self.col_sessions.document(f"{app_name}:{user_id}:{sid}")
-        if state:
-            filtered_state = {
-                k: v for k, v in state.items() if not k.startswith("temp:")
-            }
-        else:
-            filtered_state = {}
+        doc_ref, _ = self._refs_for(app_name, user_id, sid)
+        filtered_state = _persistent_state(state) if state else {}
 
         await doc_ref.set(
             {
@@ -84,17 +234,22 @@ class FirestoreSessionService(BaseSessionService):
                 "state": filtered_state,
                 "create_time": now,
                 "update_time": now,
-                "ttl": now + timedelta(days=180),
+                "ttl": now + _SESSION_TTL,
             }
         )
 
-        return Session(
+        session = Session(
             app_name=str(app_name),
             user_id=str(user_id),
             id=str(sid),
             state=state or {},
             last_update_time=now.timestamp(),
         )
+        self._cache_session(
+            (session.app_name, session.user_id, session.id),
+            session.model_copy(deep=True),
+        )
+        return session
 
     @override
     async def get_session(
@@ -105,12 +260,37 @@ class FirestoreSessionService(BaseSessionService):
         session_id: str,
         config: Optional[GetSessionConfig] = None,
     ) -> Optional[Session]:
-        doc_ref = self.col_sessions.document(f"{app_name}:{user_id}:{session_id}")
+        # Serve recent sessions from the in-process cache; config filters
+        # apply cleanly because only fully-loaded sessions are cached.
+        cache_key = (app_name, user_id, session_id)
+        cached = self._cached_session(cache_key)
+        if cached is not None:
+            session = cached.model_copy(deep=True)
+            if config:
+                if config.num_recent_events:
+                    session.events = session.events[-config.num_recent_events :]
+                elif config.after_timestamp:
+                    session.events = [
+                        e
+                        for e in session.events
+                        if e.timestamp >= config.after_timestamp
+                    ]
+            return session
+
+        doc_ref, events_col = self._refs_for(
+            app_name, user_id, session_id, self._pick_client_idx()
+        )
         snap = await doc_ref.get()
         if not snap.exists:
             return None
 
         data = snap.to_dict() or {}
+        if self._ttl_policy_enabled:
+            # Deleted-by-backdate sessions stay readable until Firestore's
+            # TTL sweep catches up; treat them as gone on every replica.
+            ttl = data.get("ttl")
+            if ttl is not None and ttl <= _now_utc():
+                return None
         update_ts = data.get("update_time", _now_utc()).timestamp()
         session = Session(
             app_name=str(app_name),
@@ -120,38 +300,43 @@ class FirestoreSessionService(BaseSessionService):
             last_update_time=update_ts,
         )
 
-        # Load events from subcollection
-        events_col = doc_ref.collection("events")
-        query = events_col.order_by("timestamp")
-        if config and config.after_timestamp:
-            query = query.where(
-                filter=FieldFilter(
-                    "timestamp",
-                    ">=",
-                    datetime.fromtimestamp(config.after_timestamp, tz=timezone.utc),
+        # Load events from subcollection, pushing filters server-side so we
+        # only read (and get billed for) the documents we keep.
+        reverse = False
+        if config and config.num_recent_events:
+            # Newest k events only; restore ascending order in Python.
+            query = events_col.order_by(
+                "timestamp", direction=Query.DESCENDING
+            ).limit(config.num_recent_events)
+            reverse = True
+        else:
+            query = events_col.order_by("timestamp")
+            if config and config.after_timestamp:
+                query = query.where(
+                    filter=FieldFilter(
+                        "timestamp",
+                        ">=",
+                        datetime.fromtimestamp(
+                            config.after_timestamp, tz=timezone.utc
+                        ),
+                    )
                 )
-            )
 
-        events_docs = [d async for d in query.stream()]
+        # Single pass: decode and apply the update_time cutoff (Vertex
+        # parity) while streaming, instead of materializing the snapshot
+        # list, the decoded list and the filtered list separately.
         events: list[Event] = [
-            self._doc_to_event(d.to_dict() or {}) for d in events_docs
+            e
+            async for d in query.select(_EVENT_FIELDS).stream()
+            if (e := self._doc_to_event(d.to_dict() or {})).timestamp <= update_ts
         ]
-
-        # Keep only events with ts <= update_time (Vertex parity)
-        events = [e for e in events if e.timestamp <= update_ts]
-
-        # Post-filtering like Vertex implementation
-        if config:
-            if config.num_recent_events:
-                events = events[-config.num_recent_events :]
-            elif config.after_timestamp:
-                i = len(events) - 1
-                while i >= 0 and events[i].timestamp >= config.after_timestamp:
-                    i -= 1
-                if i >= 0:
-                    events = events[i:]
-
+        if reverse:
+            events.reverse()
         session.events = events
+
+        # Only unfiltered reads represent the full session; cache those.
+        if not config or not (config.num_recent_events or config.after_timestamp):
+            self._cache_session(cache_key, session.model_copy(deep=True))
         return session
 
     @override
@@ -160,37 +345,81 @@ class FirestoreSessionService(BaseSessionService):
     ) -> ListSessionsResponse:
         if not user_id:
             raise ValueError("user_id must be provided to list sessions.")
-        q = self.col_sessions.where(
-            filter=FieldFilter("app_name", "==", app_name)
-        ).where(filter=FieldFilter("user_id", "==", user_id))
-        snaps = [s async for s in q.stream()]
+        # Project only the fields the response needs and page through the
+        # results so a user with many sessions costs O(page) per RPC instead
+        # of one unbounded full-document scan.
+        base = (
+            self.col_sessions.where(filter=FieldFilter("app_name", "==", app_name))
+            .where(filter=FieldFilter("user_id", "==", user_id))
+            .select(["id", "state", "update_time", "ttl"])
+            .limit(_LIST_PAGE_SIZE)
+        )
 
         sessions: list[Session] = []
-        for s in snaps:
-            d = s.to_dict() or {}
-            sessions.append(
-                Session(
-                    app_name=app_name,
-                    user_id=user_id,
-                    id=d.get("id"),
-                    state=d.get("state", {}),
-                    last_update_time=(d.get("update_time") or _now_utc()).timestamp(),
+        last_snap = None
+        now = _now_utc()
+        while True:
+            q = base.start_after(last_snap) if last_snap is not None else base
+            page_count = 0
+            async for s in q.stream():
+                page_count += 1
+                last_snap = s
+                d = s.to_dict() or {}
+                if self._ttl_policy_enabled:
+                    ttl = d.get("ttl")
+                    if ttl is not None and ttl <= now:
+                        continue
+                sessions.append(
+                    Session(
+                        app_name=app_name,
+                        user_id=user_id,
+                        id=d.get("id"),
+                        state=d.get("state", {}),
+                        last_update_time=(
+                            d.get("update_time") or _now_utc()
+                        ).timestamp(),
+                    )
                 )
-            )
+            if page_count < _LIST_PAGE_SIZE:
+                break
         return ListSessionsResponse(sessions=sessions)
 
     @override
     async def delete_session(
         self, *, app_name: str, user_id: str, session_id: str
     ) -> None:
-        doc_ref = self.col_sessions.document(f"{app_name}:{user_id}:{session_id}")
-        # Delete events subcollection in batches
-        events_col = doc_ref.collection("events")
-        batch = self.client.batch()
-        # Stream then batch-delete
-        async for ev in events_col.stream():
-            batch.delete(ev.reference)
-        await batch.commit()
+        self._session_cache.pop((app_name, user_id, session_id), None)
+        if self._ttl_policy_enabled:
+            # Expire the session doc instead of deleting it: one update RPC
+            # and Firestore's TTL sweep removes it server-side (within its
+            # usual ~24h window). Event docs carry their own write-time ttl,
+            # so the subcollection walk is skipped entirely.
+            doc_ref, _ = self._refs_for(app_name, user_id, session_id)
+            await doc_ref.update({"ttl": _now_utc() - timedelta(seconds=1)})
+            return
+        client_idx = self._pick_client_idx()
+        doc_ref, events_col = self._refs_for(
+            app_name, user_id, session_id, client_idx
+        )
+        # Collect event references via an empty projection (only __name__ is
+        # fetched), then delete them in parallel 500-op batches.
+        refs = [snap.reference async for snap in events_col.select([]).stream()]
+        if refs:
+            semaphore = asyncio.Semaphore(_DELETE_CONCURRENCY)
+
+            async def _commit_chunk(chunk):
+                batch = self._clients[client_idx].batch()
+                for ref in chunk:
+                    batch.delete(ref)
+                async with semaphore:
+                    await batch.commit()
+
+            await asyncio.gather(
+                *(
+                    _commit_chunk(refs[i : i + _DELETE_BATCH_SIZE])
+                    for i in range(0, len(refs), _DELETE_BATCH_SIZE)
+                )
+            )
         # Delete the session document
         await doc_ref.delete()
 
@@ -199,37 +428,48 @@ class FirestoreSessionService(BaseSessionService):
         # Update in-memory first (BaseSessionService mutates session.state)
         await super().append_event(session=session, event=event)
 
-        doc_ref = self.col_sessions.document(
-            f"{session.app_name}:{session.user_id}:{session.id}"
+        client_idx = self._pick_client_idx()
+        doc_ref, events_col = self._refs_for(
+            session.app_name, session.user_id, session.id, client_idx
         )
-        events_col = doc_ref.collection("events")
 
-        # Persist event document
-        event_doc = self._event_to_doc(session, event)
-        await events_col.add(event_doc)
-
-        # Touch session's update_time and persist merged state
+        # Persist the event document and the session update_time/state patch
+        # atomically in one RPC instead of two sequential round-trips.
         now = _now_utc()
+        filtered_state = _persistent_state(session.state)
 
-        filtered_state = {
-            k: v for k, v in session.state.items() if not k.startswith("temp:")
-        }
-        await doc_ref.update(
+        batch = self._clients[client_idx].batch()
+        batch.create(events_col.document(), self._event_to_doc(session, event))
+        batch.update(
+            doc_ref,
             {
                 "state": filtered_state,
                 "update_time": now,
-            }
+            },
         )
+        await batch.commit()
+
+        # Keep the in-process copy current so the next get_session within
+        # the TTL doesn't need to re-read what this process just wrote.
+        cache_key = (session.app_name, session.user_id, session.id)
+        cached = self._cached_session(cache_key)
+        if cached is not None:
+            cached.events.append(event)
+            cached.state = dict(session.state)
+            cached.last_update_time = now.timestamp()
+            self._cache_session(cache_key, cached)
 
         return event
 
     def _event_to_doc(self, session: Session, event: Event) -> Dict[str, Any]:
-        content_json = _safe_model_dump(event.content)
-        grounding_json = _safe_model_dump(event.grounding_metadata)
+        content_json, content_zstd = _maybe_compress(_safe_model_dump(event.content))
+        grounding_json, grounding_zstd = _maybe_compress(
+            _safe_model_dump(event.grounding_metadata)
+        )
 
-        actions_bytes: bytes | None = None
+        actions_dict: Dict[str, Any] | None = None
         if event.actions is not None:
-            actions_bytes = pickle.dumps(event.actions)
+            actions_dict = _safe_model_dump(event.actions)
 
         return {
             "id": event.id,
@@ -241,24 +481,36 @@ class FirestoreSessionService(BaseSessionService):
             "branch": event.branch,
             "timestamp": datetime.fromtimestamp(event.timestamp, tz=timezone.utc),
             "content": content_json,
-            "actions": actions_bytes,  # stored as bytes in Firestore
+            "content_zstd": content_zstd,
+            "actions": actions_dict,  # JSON-compatible map, queryable in Firestore
             "long_running_tool_ids": (
                 list(event.long_running_tool_ids)
                 if event.long_running_tool_ids
                 else None
             ),
             "grounding_metadata": grounding_json,
+            "grounding_metadata_zstd": grounding_zstd,
             "partial": event.partial,
             "turn_complete": event.turn_complete,
             "error_code": event.error_code,
             "error_message": event.error_message,
             "interrupted": event.interrupted,
+            "ttl": _now_utc() + _SESSION_TTL,
         }
 
     def _doc_to_event(self, d: Dict[str, Any]) -> Event:
         actions_obj: EventActions | None = None
         raw_actions = d.get("actions")
-        if isinstance(raw_actions, (bytes, bytearray)):
+        if isinstance(raw_actions, dict):
+            try:
+                actions_obj = EventActions.model_validate(raw_actions)
+            except Exception:
+                actions_obj = None
+        elif isinstance(raw_actions, (bytes, bytearray)):
+            # Rows persisted before actions were stored as dicts; read-only
+            # migration path, so pickle is only imported when one is hit.
+            import pickle
+
             try:
                 actions_obj = pickle.loads(bytes(raw_actions))
             except Exception:
@@ -271,12 +523,14 @@ class FirestoreSessionService(BaseSessionService):
             branch=d.get("branch"),
             actions=actions_obj or EventActions(),
             timestamp=(d.get("timestamp") or _now_utc()).timestamp(),
-            content=d.get("content"),
+            content=_maybe_decompress(d.get("content"), d.get("content_zstd")),
             long_running_tool_ids=set(d.get("long_running_tool_ids") or []),
             partial=d.get("partial"),
             turn_complete=d.get("turn_complete"),
             error_code=d.get("error_code"),
             error_message=d.get("error_message"),
             interrupted=d.get("interrupted"),
-            grounding_metadata=d.get("grounding_metadata"),
+            grounding_metadata=_maybe_decompress(
+                d.get("grounding_metadata"), d.get("grounding_metadata_zstd")
+            ),
         )
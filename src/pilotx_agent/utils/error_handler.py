@@ -20,7 +20,7 @@ def handle_tool_error(
         error_name = error
         error_detail = detail or "Unknown error"
 
-    logger.error(f"Error in {tool_name} tool: {error_name} - {error_detail}")
+    logger.error("Error in %s tool: %s - %s", tool_name, error_name, error_detail)
 
     return {
         "status": "error",
@@ -36,7 +36,7 @@ def handle_tool_error_with_message(
     """
     Handles tool errors by logging them and returning a standardized error response.
     """
-    logger.error(f"Error in {tool_name} tool: {error_name} - {error_detail}")
+    logger.error("Error in %s tool: %s - %s", tool_name, error_name, error_detail)
 
     return {
         "status": "error",
@@ -46,6 +46,18 @@ def handle_tool_error_with_message(
     }
 
 
+def _handle_exception(tool_name: str, e: Exception) -> dict[str, Any]:
+    # Module-level so each decorator application reuses one function instead
+    # of building a fresh closure per wrapped tool.
+    if isinstance(e, RetryError):
+        last_exc = e.last_attempt.exception()
+        logger.error(
+            "[tool: %s] Retry failed after all attempts: %s", tool_name, last_exc
+        )
+        return handle_tool_error(tool_name, last_exc)
+    return handle_tool_error(tool_name, e)
+
+
 def wrap_tool_with_retry_handling(tool_name: str):
     """
     Decorator that wraps a retried tool function to catch RetryError and return
@@ -58,15 +70,14 @@ def wrap_tool_with_retry_handling(tool_name: str):
     """
 
     def decorator(func: T) -> T:
-        def _handle_exception(e: Exception) -> dict[str, Any]:
-            if isinstance(e, RetryError):
-                last_exc = e.last_attempt.exception()
-                logger.error(
-                    f"[tool: {tool_name}] Retry failed after all attempts: {last_exc}"
-                )
-                return handle_tool_error(tool_name, last_exc)
-            else:
-                return handle_tool_error(tool_name, e)
+        # Tenacity attaches a ``retry`` attribute to functions it wraps; a
+        # RetryError can only surface from those, so plain tools get the
+        # direct error handler and skip the isinstance check per call.
+        handle = (
+            _handle_exception
+            if getattr(func, "retry", None) is not None
+            else handle_tool_error
+        )
 
         if asyncio.iscoroutinefunction(func):
 
@@ -75,7 +86,7 @@ def wrap_tool_with_retry_handling(tool_name: str):
                 try:
                     return await func(*args, **kwargs)
                 except Exception as e:
-                    return _handle_exception(e)
+                    return handle(tool_name, e)
 
             return cast(T, wrapper)
         else:
@@ -85,7 +96,7 @@ def wrap_tool_with_retry_handling(tool_name: str):
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
-                    return _handle_exception(e)
+                    return handle(tool_name, e)
 
             return wrapper
 